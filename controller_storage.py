@@ -3,97 +3,242 @@
 Saved BLE controller storage. Addresses are stable per device; store with names for quick connect.
 """
 
+import functools
 import json
 import os
+import sys
+import threading
+from pathlib import Path
 
+# Optional: orjson is much faster to (de)serialize; fall back to stdlib json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+def _dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _loads(raw):
+    """Parse JSON bytes. Raises ValueError (JSONDecodeError/UnicodeDecodeError) on bad input."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Parsed file contents keyed by path: path -> ((st_mtime_ns, st_size, st_ino), data). Re-parsed when any
+# of those change (the launcher and driver run in separate processes, so the file can change underneath
+# us). mtime alone can miss a write within the same coarse timestamp tick; every write os.replace()s
+# in a new file, so the inode changes too.
+_cache = {}
+# Guards _cache and every read-modify-write (BLE thread and UI may save at the same time)
+_lock = threading.RLock()
+
+
+def _stat_key(path):
+    """Identity of the file currently at path, for cache validation. Raises FileNotFoundError."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_json(path):
+    """Read the whole file in one call and parse it. Returns {} if missing or corrupt."""
+    try:
+        key = _stat_key(path)
+    except FileNotFoundError:
+        _cache.pop(path, None)
+        return {}
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        data = _loads(Path(path).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        data = {}
+    _cache[path] = (key, data)
+    return data
+
+
+_dir_ready = False
+
+
+def _ensure_dir():
+    """Create the storage directory once per process (skips the makedirs stat on later saves)."""
+    global _dir_ready
+    if _dir_ready:
+        return
+    os.makedirs(_storage_dir(), exist_ok=True)
+    _dir_ready = True
+
+
+def _write_json(path, obj):
+    """Atomically write obj to path and refresh the cache so the next read skips the parse.
+    Writes a temp file in one call then os.replace()s it over path, so a crash never leaves a torn file."""
+    _ensure_dir()
+    tmp = f"{path}.{os.getpid()}.tmp"  # per-process: launcher and driver may save concurrently
+    try:
+        Path(tmp).write_bytes(_dumps(obj))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _cache[path] = (_stat_key(path), obj)
+
+
+@functools.lru_cache(maxsize=1)
 def _storage_dir():
-    """Return config directory for this app."""
-    if os.name == "darwin":
-        base = os.path.expanduser("~/Library/Application Support")
-        return os.path.join(base, "NSO GC Bridge")
-    return os.path.expanduser("~/.config/nso-gc-bridge")
+    """Return config directory for this app (fixed for the process lifetime, so cached)."""
+    legacy = os.path.expanduser("~/.config/nso-gc-bridge")
+    if sys.platform == "darwin":
+        path = os.path.join(os.path.expanduser("~/Library/Application Support"), "NSO GC Bridge")
+        # Older builds checked os.name (never "darwin") and saved to ~/.config on macOS too; keep using it
+        if not os.path.isdir(path) and os.path.isdir(legacy):
+            return legacy
+        return path
+    return legacy
+
 
+@functools.lru_cache(maxsize=1)
+def _state_path():
+    """Saved controllers and last connected address, in one file."""
+    return os.path.join(_storage_dir(), "state.json")
 
+
+@functools.lru_cache(maxsize=1)
 def _controllers_path():
+    """Legacy (pre-state.json) saved controllers file; only read for migration."""
     return os.path.join(_storage_dir(), "controllers.json")
 
 
+@functools.lru_cache(maxsize=1)
 def _last_connected_path():
+    """Legacy (pre-state.json) last connected file; only read for migration."""
     return os.path.join(_storage_dir(), "last_connected.json")
 
 
+@functools.lru_cache(maxsize=1)
 def _slots_config_path():
     return os.path.join(_storage_dir(), "slots_config.json")
 
 
+_migrated = False
+
+
+def _migrate_legacy_files():
+    """One-shot: fold controllers.json + last_connected.json into state.json, then remove them."""
+    global _migrated
+    _migrated = True
+    if os.path.exists(_state_path()):
+        return
+    legacy = (_controllers_path(), _last_connected_path())
+    if not any(os.path.exists(p) for p in legacy):
+        return
+    state = {
+        "controllers": _read_json(_controllers_path()).get("controllers", []),
+        "last_connected": _read_json(_last_connected_path()).get("address"),
+    }
+    _write_json(_state_path(), state)
+    for p in legacy:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+        _cache.pop(p, None)
+
+
+def _load_state():
+    """Return the parsed state.json dict ({controllers, last_connected}). Do not mutate."""
+    with _lock:
+        if not _migrated:
+            _migrate_legacy_files()
+        return _read_json(_state_path())
+
+
+def _save_state(**changes):
+    """Apply changes on top of the current state and write state.json."""
+    with _lock:
+        state = dict(_load_state())
+        state.update(changes)
+        _write_json(_state_path(), state)
+
+
+def _copy_entries(entries):
+    """Copy a cached list of dict entries so callers can't mutate the shared parsed file contents."""
+    return [dict(e) if isinstance(e, dict) else e for e in entries]
+
+
 def load_controllers():
-    """Load saved controllers. Returns list of {address, name}."""
-    path = _controllers_path()
-    try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        return data.get("controllers", [])
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+    """Load saved controllers. Returns list of {address, name} (fresh copies; safe to modify)."""
+    return _copy_entries(_load_state().get("controllers", []))
 
 
 def save_controllers(controllers):
     """Save controllers list. controllers = [{address, name}, ...]."""
-    path = _controllers_path()
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump({"controllers": controllers}, f, indent=2)
+    _save_state(controllers=list(controllers))
+
+
+def _to_map(controllers):
+    """[{address, name}, ...] -> {address: name} (insertion-ordered)."""
+    return {c["address"]: c.get("name", c["address"]) for c in controllers}
+
+
+def _from_map(m):
+    """{address: name} -> [{address, name}, ...] for saving."""
+    return [{"address": address, "name": name} for address, name in m.items()]
 
 
 def add_controller(address, name):
-    """Add or update a controller. If address exists, update name."""
-    controllers = load_controllers()
+    """Add or update a controller. If address exists, update name (and move it to the end).
+    No-op (no write) when the same address is already saved under the same name."""
     address = address.strip()
-    controllers = [c for c in controllers if c["address"] != address]
-    controllers.append({"address": address, "name": name.strip() or address})
-    save_controllers(controllers)
+    name = name.strip() or address
+    with _lock:
+        m = _to_map(load_controllers())
+        if m.get(address) == name:
+            return
+        m.pop(address, None)
+        m[address] = name
+        save_controllers(_from_map(m))
 
 
 def remove_controller(address):
     """Remove a controller by address."""
-    controllers = [c for c in load_controllers() if c["address"] != address]
-    save_controllers(controllers)
+    with _lock:
+        m = _to_map(load_controllers())
+        if m.pop(address, None) is not None:
+            save_controllers(_from_map(m))
 
 
 def get_last_connected():
     """Return last connected BLE address, or None."""
-    path = _last_connected_path()
-    try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        return data.get("address")
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
+    return _load_state().get("last_connected")
 
 
 def set_last_connected(address):
-    """Record the last connected address (called by driver)."""
-    path = _last_connected_path()
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump({"address": address}, f)
+    """Record the last connected address (called by driver). No-op (no write) when unchanged."""
+    with _lock:
+        if _load_state().get("last_connected") == address:
+            return
+        _save_state(last_connected=address)
 
 
 def load_slots_config():
-    """Load multi-controller slots config. Returns list of {slot, type, address?}."""
-    path = _slots_config_path()
-    try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        return data.get("slots", [])
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+    """Load multi-controller slots config. Returns list of {slot, type, address?} (fresh copies)."""
+    with _lock:
+        return _copy_entries(_read_json(_slots_config_path()).get("slots", []))
 
 
 def save_slots_config(slots):
     """Save slots config. slots = [{slot: 0-3, type: 'usb'|'ble', address?: str}, ...]."""
-    path = _slots_config_path()
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump({"slots": slots}, f, indent=2)
+    with _lock:
+        _write_json(_slots_config_path(), {"slots": list(slots)})
@@ -6,8 +6,13 @@ This implements the DSU protocol to send controller data over UDP to Dolphin.
 No kernel extensions or virtual HID devices needed - just UDP packets!
 """
 
+import errno
+import math
+import os
+import selectors
 import socket
 import struct
+import sys
 import zlib
 import time
 import threading
@@ -15,6 +20,25 @@ import subprocess
 from typing import Callable, Dict, Optional, Set
 
 
+# Precompiled little-endian field formats
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+# Packet header through message type: magic, protocol version, length, CRC32, server ID, message type
+_HEADER = struct.Struct('<4sHHIII')
+# Just the magic and message type of a client request (skips version, length, CRC, client ID)
+_REQUEST_KIND = struct.Struct('<4s12xI')
+
+# Pad data bytes 20-35: pad ID, state, model, connection, MAC prefix, MAC last byte, battery, active, counter
+_PAD_DATA_SLOT = struct.Struct('<BBBB5sBBBI')
+# Pad data bytes 40-43 (left X/Y, right X/Y) and 54-55 (L2, R2)
+_PAD_DATA_STICKS = struct.Struct('<4B')
+_PAD_DATA_TRIGGERS = struct.Struct('<2B')
+
+# Pads report MAC 00:11:22:33:44:<pad_id>
+_FAKE_MAC_PREFIX = b'\x00\x11\x22\x33\x44'
+
+
 def send_test_rumble(port: int = 26760, slot: int = 0, duration_ms: int = 500) -> bool:
     """Send a test rumble burst to the DSU server (for Test Rumble button).
     Sends ON, waits duration_ms, then OFF. Returns True if packets were sent."""
@@ -30,15 +54,10 @@ def send_test_rumble(port: int = 26760, slot: int = 0, duration_ms: int = 500) -
             payload[9] = intensity & 0xFF
             # Header: magic, version, length, crc, server_id, msg_type
             pkt = bytearray(30)
-            pkt[0:4] = b'DSUC'
-            struct.pack_into('<H', pkt, 4, 1001)
-            struct.pack_into('<H', pkt, 6, 14)  # 4 (msg type) + 10 (payload)
-            struct.pack_into('<I', pkt, 12, 0)
-            struct.pack_into('<I', pkt, 16, 0x110002)
+            _HEADER.pack_into(pkt, 0, b'DSUC', 1001, 14, 0, 0, 0x110002)  # length: 4 (msg type) + 10 (payload)
             pkt[20:30] = payload
-            pkt[8:12] = b'\x00\x00\x00\x00'
-            crc = zlib.crc32(bytes(pkt)) & 0xFFFFFFFF
-            struct.pack_into('<I', pkt, 8, crc)
+            # CRC over the whole packet while the CRC field is still zero
+            _U32.pack_into(pkt, 8, zlib.crc32(pkt))
             return bytes(pkt)
         addr = ('127.0.0.1', port)
         sock.sendto(build_rumble_packet(255), addr)
@@ -75,6 +94,114 @@ def free_orphaned_port(port: int = 26760) -> bool:
         return False
 
 
+def raise_current_thread_priority(rt_priority: int, policy: str = 'SCHED_RR'):
+    """Best effort: let the calling thread preempt ordinary CPU-bound work (DSU handler, USB reads).
+    Linux: real-time policy (name of an os.SCHED_* constant) at rt_priority (needs root or
+    CAP_SYS_NICE). Windows: THREAD_PRIORITY_HIGHEST.
+    Silently keeps the default priority when not permitted or unsupported (e.g. macOS)."""
+    try:
+        if hasattr(os, 'sched_setscheduler'):
+            # pid 0 = calling thread on Linux
+            os.sched_setscheduler(0, getattr(os, policy), os.sched_param(rt_priority))
+        elif sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 2)  # THREAD_PRIORITY_HIGHEST
+    except (OSError, AttributeError):
+        pass
+
+
+# GameCube button -> (packet byte, bit) in the DS4 button bytes 36-39 of a pad data packet
+_DS4_BUTTON_BITS = (
+    # Byte 36: D-Pad, Options, R3, L3, Share
+    # Bits: 0:Share, 1:L3, 2:R3, 3:Options, 4:Up, 5:Right, 6:Down, 7:Left
+    ('Dpad_Up', 36, 1 << 4),
+    ('Dpad_Right', 36, 1 << 5),
+    ('Dpad_Down', 36, 1 << 6),
+    ('Dpad_Left', 36, 1 << 7),
+    ('Start', 36, 1 << 3),  # Start -> Options
+    ('Z', 36, 1 << 2),  # Z -> R3 (Right stick click, separate from analog triggers)
+    # Byte 37: Square, Cross, Circle, Triangle, R1, L1, R2, L2
+    # Bits: 0:L2, 1:R2, 2:L1, 3:R1, 4:Triangle, 5:Circle, 6:Cross, 7:Square
+    ('X', 37, 1 << 7),  # X -> Square
+    ('A', 37, 1 << 6),  # A -> Cross
+    ('B', 37, 1 << 5),  # B -> Circle
+    ('Y', 37, 1 << 4),  # Y -> Triangle
+    ('R', 37, 1 << 3),  # R -> R1
+    ('L', 37, 1 << 2),  # L -> L1
+    ('ZL', 37, 1 << 0),  # ZL -> L2 (Digital)
+    # Byte 38: PS Button (Home)
+    ('Home', 38, 1 << 0),
+    # Byte 39: Touchpad Click (Capture -> Touchpad)
+    ('Capture', 39, 1 << 0),
+)
+
+# GameCube button -> analog pressure byte (255 when pressed, 0 when not)
+_DS4_ANALOG_BUTTONS = (
+    # Bytes 44-47: Analog D-Pad (Left, Down, Right, Up)
+    ('Dpad_Left', 44),
+    ('Dpad_Down', 45),
+    ('Dpad_Right', 46),
+    ('Dpad_Up', 47),
+    # Bytes 48-51: Analog buttons (Y/Triangle, B/Circle, A/Cross, X/Square)
+    ('Y', 48),
+    ('B', 49),
+    ('A', 50),
+    ('X', 51),
+    # Bytes 52-53: Analog R1, L1 (R, L buttons)
+    ('R', 52),
+    ('L', 53),
+)
+
+# Both tables merged for the packet builder, one entry per button: (name, bit in the little-endian
+# 32-bit word at bytes 36-39, analog byte or 0)
+_DS4_BUTTON_OUTPUT = tuple(
+    (name, bit << (8 * (offset - 36)), dict(_DS4_ANALOG_BUTTONS).get(name, 0))
+    for name, offset, bit in _DS4_BUTTON_BITS
+)
+
+# Bit layout for drivers that pass 'buttons' as a packed int instead of a dict: bit i = BUTTON_NAMES[i]
+BUTTON_NAMES = (
+    'Dpad_Up', 'Dpad_Right', 'Dpad_Down', 'Dpad_Left', 'Start', 'Z',
+    'X', 'A', 'B', 'Y', 'R', 'L', 'ZL', 'Home', 'Capture',
+)
+BUTTON_MASKS = {name: 1 << i for i, name in enumerate(BUTTON_NAMES)}
+_ALL_BUTTONS_MASK = (1 << len(BUTTON_NAMES)) - 1
+
+# Bit index -> (button word bit, analog byte or 0) for packed buttons
+_PACKED_BUTTON_OUTPUT = tuple(
+    {entry[0]: entry[1:] for entry in _DS4_BUTTON_OUTPUT}[name] for name in BUTTON_NAMES
+)
+
+
+# Stick offset (from center) that reports full deflection, and the derived per-packet constants
+STICK_MAX_RANGE = 1400.0
+_STICK_MAX_RANGE_SQUARED = STICK_MAX_RANGE * STICK_MAX_RANGE
+_STICK_BYTE_SCALE = 127 / STICK_MAX_RANGE
+
+
+def _stick_pair_to_bytes(x, y):
+    """
+    Convert a signed stick offset pair to DSU stick bytes (0-255, 128 is center), Y inverted.
+    Uses circular normalization so diagonals reach the same magnitude as cardinals; offsets at or
+    beyond STICK_MAX_RANGE report full deflection.
+    
+    Args:
+        x: Signed offset in X axis
+        y: Signed offset in Y axis
+    
+    Returns:
+        Tuple of (x_byte, y_byte); both are always within 1-255, so no masking is needed
+    """
+    squared = x * x + y * y
+    if squared <= _STICK_MAX_RANGE_SQUARED:
+        # Inside the circle nothing is clamped: a fixed linear map (no sqrt, no division)
+        return int(x * _STICK_BYTE_SCALE + 128), int(-y * _STICK_BYTE_SCALE + 128)
+    # Beyond full deflection: clamp the magnitude to 1, scaling both axes to keep the direction
+    scale = 1.0 / math.sqrt(squared)
+    return int(x * scale * 127 + 128), int(-y * scale * 127 + 128)
+
+
 class DSUServer:
     """
     DSU Server that broadcasts controller data over UDP.
@@ -91,6 +218,13 @@ class DSUServer:
     PACKET_TYPE_PAD_INFO = 0x00100001  # Changed from 0x01000001
     PACKET_TYPE_PAD_DATA = 0x00100002  # Changed from 0x01000002
     PACKET_TYPE_RUMBLE = 0x110002  # Unofficial: rumble controller motor
+    PAD_INFO_CACHE_MAX = 64  # Cleared when full (normally ~8 entries: 4 slots x connected or not)
+    BROADCAST_INTERVAL_SEC = 0.005  # Pad data push to subscribed clients between their own requests
+    RECV_BATCH_MAX = 64  # Requests handled per wakeup before the broadcast gets a turn
+    SOCKET_SNDBUF_BYTES = 512 * 1024
+    SOCKET_RCVBUF_BYTES = 256 * 1024
+    # Real-time priority of the handler thread; below the controller read thread, which feeds it
+    HANDLER_THREAD_RT_PRIORITY = 5
 
     def __init__(self, server_id: int = 0):
         self.server_id = server_id
@@ -100,15 +234,37 @@ class DSUServer:
         self.packet_counter = 0
         # Multi-slot: state and button latch per pad (0-3)
         self.last_state_by_slot: Dict[int, Dict] = {}
+        self._connection_type_by_slot: Dict[int, int] = {}
         self.pending_presses_by_slot: Dict[int, Set[str]] = {}
+        # Buttons dict last scanned for presses per pad (drivers reuse it while buttons are unchanged)
+        self._latched_buttons_by_slot: Dict[int, Dict] = {}
         self.thread = None
+        self._wakeup_recv = None
+        self._wakeup_send = None
         self._logged_clients = set()
+        # Pad Data subscribers (handler thread only): addr -> set of slot ids they requested, plus the
+        # (addr, slots) snapshot the broadcast iterates, rebuilt only when a subscription changes
+        self._clients: Dict[tuple, set] = {}
+        self._client_items: tuple = ()
+        # Client message type -> handler(data, addr)
+        self._request_handlers: Dict[int, Callable[[bytes, tuple], None]] = {
+            self.PACKET_TYPE_VERSION: self._respond_version,
+            self.PACKET_TYPE_PAD_INFO: self._respond_pad_info,
+            self.PACKET_TYPE_PAD_DATA: self._respond_pad_data,
+            self.PACKET_TYPE_RUMBLE: self._handle_rumble,
+        }
         # Rumble: pad_id -> callback(large_motor, small_motor)
         self._rumble_callbacks: Dict[int, Callable[[int, int], None]] = {}
         # Pre-allocate packet buffers to avoid GC pressure
-        self._pad_data_buffer = bytearray(100)
+        # Pad data: pad_id -> [state it was built from (None = don't reuse), connection_type, 100-byte buffer]
+        self._pad_data_cache: Dict[int, list] = {}
+        self._pad_data_template = self._build_pad_data_template()
+        # The pad data header (bytes 0-19) never changes, so its CRC is computed once
+        self._pad_data_header_crc = zlib.crc32(self._pad_data_template[:20])
         self._version_buffer = bytearray(24)
-        self._pad_info_buffer = bytearray(32)
+        self._pad_info_buffer = self._build_pad_info_template()
+        # Built pad info packets: (slot, server_id, connected, connection_type) -> bytes
+        self._pad_info_cache: Dict[tuple, bytes] = {}
         
     def start(self):
         """Start the DSU server and the background handler.
@@ -119,9 +275,19 @@ class DSUServer:
             try:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                # Room for bursts of responses; the OS may cap these, which is fine
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_SNDBUF_BYTES)
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_RCVBUF_BYTES)
+                except OSError:
+                    pass
                 self.socket.bind(('127.0.0.1', port))
                 self.port = port
-                self.socket.settimeout(0.005)  # 5ms timeout - wakes thread immediately when packet arrives
+                # Non-blocking: handle_requests waits in select(), and a full send buffer drops the
+                # packet (a newer one follows within milliseconds) instead of stalling the handler
+                self.socket.setblocking(False)
+                # stop() writes to this pair to wake a handler that is idle in select()
+                self._wakeup_recv, self._wakeup_send = socket.socketpair()
                 self.running = True
 
                 # CRITICAL: Start the request handler in a background thread
@@ -143,7 +309,7 @@ class DSUServer:
                     except Exception:
                         pass
                     self.socket = None
-                if e.errno != 48:  # 48 = Address already in use
+                if e.errno != errno.EADDRINUSE:  # 48 on macOS, 98 on Linux, 10048 on Windows
                     break
             except Exception as e:
                 last_err = e
@@ -163,64 +329,89 @@ class DSUServer:
     def stop(self):
         """Stop the DSU server."""
         self.running = False
+        if self._wakeup_send:
+            try:
+                self._wakeup_send.send(b'\x00')
+            except OSError:
+                pass
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=1.0)
         if self.socket:
             self.socket.close()
             self.socket = None
+        for wakeup in (self._wakeup_recv, self._wakeup_send):
+            if wakeup:
+                wakeup.close()
+        self._wakeup_recv = self._wakeup_send = None
     
-    def _calculate_crc32(self, data: bytes) -> int:
-        """Calculate CRC32 checksum for packet."""
-        return zlib.crc32(data) & 0xFFFFFFFF
+    def _finalize_crc(self, packet: bytearray, header_crc: Optional[int] = None) -> None:
+        """Write the packet's CRC32 into bytes 8-11. The CRC covers the whole packet with the CRC
+        field zeroed: the field is zeroed in place and the bytearray hashed directly (no copy).
+        header_crc: CRC32 of bytes 0-19 (CRC field zeroed) when the caller knows they are fixed;
+        then only the payload from byte 20 is hashed."""
+        if header_crc is None:
+            _U32.pack_into(packet, 8, 0)
+            crc = zlib.crc32(packet)  # Already unsigned on Python 3, no masking needed
+        else:
+            with memoryview(packet) as view:
+                crc = zlib.crc32(view[20:], header_crc)
+        _U32.pack_into(packet, 8, crc)
     
-    def _create_pad_info_packet(self, pad_id: int = 0, connected: bool = True, server_id: int = None, connection_type: int = 0x01) -> bytes:
+    def _create_pad_info_packet(self, pad_id: int = 0, connected: bool = True, server_id: int = None, connection_type: int = 0x01) -> bytearray:
         """
         Create a DSU pad info packet (response to Pad Info Request).
         connection_type: 0x01=USB, 0x02=Bluetooth
 
         Total size: 32 bytes (16 header + 4 type + 12 payload)
+        Returns the shared buffer (no copy): send it before building the next pad info packet.
         """
         if server_id is None:
             server_id = self.server_id
         
-        # Use pre-allocated buffer to avoid GC pressure
+        # Pre-allocated buffer, prefilled with the constant fields (see _build_pad_info_template);
+        # only the per-request fields are written here
         packet = self._pad_info_buffer
-        packet[:] = b'\x00' * 32  # Clear buffer
-        
-        # Header
-        packet[0:4] = b'DSUS'
-        struct.pack_into('<H', packet, 4, self.PROTOCOL_VERSION)
-        struct.pack_into('<H', packet, 6, 16)  # 4 (type) + 12 (payload)
         
         # Server ID
-        struct.pack_into('<I', packet, 12, server_id)
-        
-        # Message type: 0x00100001
-        struct.pack_into('<I', packet, 16, self.PACKET_TYPE_PAD_INFO)
+        _U32.pack_into(packet, 12, server_id)
         
         # Pad Info
         packet[20] = pad_id
         packet[21] = 0x02 if connected else 0x00  # 2=Connected, 0=Not connected
-        # Model: 0x02 = DualShock 4
-        packet[22] = 0x02
         # Connection: 0x01 = USB, 0x02 = Bluetooth
         packet[23] = connection_type if connected else 0x00
-        # MAC Address (6 bytes)
-        packet[24:30] = bytes([0x00, 0x11, 0x22, 0x33, 0x44, pad_id])
+        # MAC Address: last byte (prefix is in the template)
+        packet[29] = pad_id
         
         packet[30] = 0x05 if connected else 0x00  # Battery: 0x05 = Full, 0x00 = Not applicable
-        packet[31] = 0x00  # Termination byte
         
-        # CRC calculation: over whole packet (bytes 0-31) with CRC field (bytes 8-11) zeroed
-        crc_field_backup = packet[8:12]
-        packet[8:12] = b'\x00\x00\x00\x00'
-        crc32 = self._calculate_crc32(bytes(packet))
-        packet[8:12] = crc_field_backup
-        struct.pack_into('<I', packet, 8, crc32)
+        self._finalize_crc(packet)
         
-        return bytes(packet)
+        return packet
+    
+    def _build_pad_info_template(self) -> bytearray:
+        """Return the 32-byte pad info packet with its constant fields filled in. Server ID (bytes
+        12-15), pad ID (20), state (21), connection (23), last MAC byte (29) and battery (30) vary."""
+        packet = bytearray(32)
+        # Header (length 16 = 4 (type) + 12 (payload)), CRC placeholder, message type 0x00100001
+        _HEADER.pack_into(packet, 0, b'DSUS', self.PROTOCOL_VERSION, 16, 0, self.server_id, self.PACKET_TYPE_PAD_INFO)
+        # Model: 0x02 = DualShock 4
+        packet[22] = 0x02
+        # MAC Address prefix (6 bytes with the pad ID)
+        packet[24:29] = _FAKE_MAC_PREFIX
+        packet[31] = 0x00  # Termination byte
+        return packet
     
-    def _create_pad_data_packet(self, state: Dict, pad_id: int = 0, connection_type: int = 0x01) -> bytes:
+    def _build_pad_data_template(self) -> bytearray:
+        """Return the 100-byte pad data packet with the header (constant per server) filled in and
+        everything else zero. Bytes 20-35 are packed per packet with _PAD_DATA_SLOT."""
+        packet = bytearray(100)
+        # Header: "DSUS", protocol version, packet length 84 (excluding 16-byte header),
+        # CRC32 placeholder (zero), server ID, PadDataRsp 0x1000002
+        _HEADER.pack_into(packet, 0, b'DSUS', self.PROTOCOL_VERSION, 84, 0, self.server_id, self.PACKET_TYPE_PAD_DATA)
+        return packet
+    
+    def _create_pad_data_packet(self, state: Dict, pad_id: int = 0, connection_type: int = 0x01) -> bytearray:
         """
         Create a DSU pad data packet. Parses on-demand from raw bytes for minimum latency.
         connection_type: 0x01=USB, 0x02=Bluetooth
@@ -242,7 +433,22 @@ class DSUServer:
         - Sticks: bytes 40-43
         - Triggers: bytes 54-55
         - Rest: padding/IMU data
+        
+        Built once per state object: while the slot's state is unchanged only the counter and CRC are
+        rewritten in the slot's cached buffer. That buffer is returned as-is (no copy), so send it
+        before building the next packet for the same slot.
         """
+        pending = self.pending_presses_by_slot.get(pad_id)
+        cached = self._pad_data_cache.get(pad_id)
+        if cached is None:
+            cached = self._pad_data_cache[pad_id] = [None, None, bytearray(100)]
+        packet = cached[2]
+        if cached[0] is state and cached[1] == connection_type and not pending:
+            self.packet_counter += 1
+            _U32.pack_into(packet, 32, self.packet_counter)
+            self._finalize_crc(packet, self._pad_data_header_crc)
+            return packet
+        
         # Parse on-demand from raw bytes if available (faster - parse only when sending)
         if 'raw_bytes' in state and 'parsed' in state:
             # Use pre-parsed data if available (fallback)
@@ -252,250 +458,131 @@ class DSUServer:
             parsed = state
         
         # Get buttons and apply state latch - force pending presses to True
-        buttons = parsed.get('buttons', {}).copy()  # Copy to avoid modifying original
-        pending = self.pending_presses_by_slot.get(pad_id, set())
-        for btn in list(pending):
-            buttons[btn] = True
+        buttons = parsed.get('buttons', {})
+        if isinstance(buttons, int):
+            if pending:
+                for btn in list(pending):
+                    buttons |= BUTTON_MASKS.get(btn, 0)
+        elif pending:
+            buttons = dict(buttons)  # Copy to avoid modifying original
+            for btn in list(pending):
+                buttons[btn] = True
         
         sticks = parsed.get('sticks', {})
         trigger_l = parsed.get('trigger_l', 0)
         trigger_r = parsed.get('trigger_r', 0)
         
-        # Use pre-allocated buffer to avoid GC pressure
-        packet = self._pad_data_buffer
-        packet[:] = b'\x00' * 100  # Clear buffer
-        
-        # Header: "DSUS"
-        packet[0:4] = b'DSUS'
-        
-        # Protocol version: 1001 (little-endian)
-        struct.pack_into('<H', packet, 4, self.PROTOCOL_VERSION)
-        
-        # Packet length: 84 (excluding 16-byte header)
-        struct.pack_into('<H', packet, 6, 84)
-        
-        # CRC32 placeholder (will calculate after)
-        # packet[8:12] = CRC32
-        
-        # Server ID
-        struct.pack_into('<I', packet, 12, self.server_id)
-        
-        # PadDataRsp: 0x1000002
-        struct.pack_into('<I', packet, 16, self.PACKET_TYPE_PAD_DATA)
-        
-        # Pad ID
-        packet[20] = pad_id
-        
-        # Pad State: 2 = connected
-        packet[21] = 2
-        
-        # Model: 0x02 = DualShock 4 (full gyro)
-        packet[22] = 0x02
-        # Connection: 0x01 = USB, 0x02 = Bluetooth
-        packet[23] = connection_type
-        
-        # MAC Address: Use a fake MAC (6 bytes)
-        packet[24:30] = bytes([0x00, 0x11, 0x22, 0x33, 0x44, pad_id])
+        # Start from the template (header; IMU bytes zero) and write only the per-packet fields.
+        # Copying into the slot's buffer avoids GC pressure
+        packet[:] = self._pad_data_template
         
-        # Battery/Active: Battery = 0x05 (full), Active = 0x01
-        packet[30] = 0x05  # Battery
-        packet[31] = 0x01  # Active
-        
-        # Packet counter
+        # Pad ID, state 2 = connected, model 0x02 = DualShock 4 (full gyro), connection (0x01 = USB,
+        # 0x02 = Bluetooth), fake MAC, battery 0x05 (full), active 0x01, packet counter: one call
         self.packet_counter += 1
-        struct.pack_into('<I', packet, 32, self.packet_counter)
-        
-        # Buttons (byte 36-39)
-        # Initialize 4 bytes of button data
-        btns = [0] * 4
-        
-        # Byte 36: D-Pad, Options, R3, L3, Share
-        # Bits: 0:Share, 1:L3, 2:R3, 3:Options, 4:Up, 5:Right, 6:Down, 7:Left
-        if buttons.get('Dpad_Up', False):
-            btns[0] |= (1 << 4)
-        if buttons.get('Dpad_Right', False):
-            btns[0] |= (1 << 5)
-        if buttons.get('Dpad_Down', False):
-            btns[0] |= (1 << 6)
-        if buttons.get('Dpad_Left', False):
-            btns[0] |= (1 << 7)
-        if buttons.get('Start', False):
-            btns[0] |= (1 << 3)  # Start -> Options
-        if buttons.get('Z', False):
-            btns[0] |= (1 << 2)  # Z -> R3 (Right stick click, separate from analog triggers)
-        
-        # Byte 37: Square, Cross, Circle, Triangle, R1, L1, R2, L2
-        # Bits: 0:L2, 1:R2, 2:L1, 3:R1, 4:Triangle, 5:Circle, 6:Cross, 7:Square
-        if buttons.get('X', False):
-            btns[1] |= (1 << 7)  # X -> Square
-        if buttons.get('A', False):
-            btns[1] |= (1 << 6)  # A -> Cross
-        if buttons.get('B', False):
-            btns[1] |= (1 << 5)  # B -> Circle
-        if buttons.get('Y', False):
-            btns[1] |= (1 << 4)  # Y -> Triangle
-        if buttons.get('R', False):
-            btns[1] |= (1 << 3)  # R -> R1
-        if buttons.get('L', False):
-            btns[1] |= (1 << 2)  # L -> L1
-        # Z is now mapped to R3 (byte 36, bit 2) instead of R2 to avoid conflict with analog trigger
-        if buttons.get('ZL', False):
-            btns[1] |= (1 << 0)  # ZL -> L2 (Digital)
-        
-        # Byte 38: PS Button (Home)
-        if buttons.get('Home', False):
-            btns[2] |= (1 << 0)
-        
-        # Byte 39: Touchpad Click (Capture -> Touchpad)
-        if buttons.get('Capture', False):
-            btns[3] |= (1 << 0)  # Capture -> Touchpad Click
-        
-        # Assign to packet
-        packet[36:40] = btns
-        
-        # Analog buttons (bytes 44-53): Set to 255 when pressed, 0 when not
-        # Bytes 44-47: Analog D-Pad (Left, Down, Right, Up)
-        packet[44] = 255 if buttons.get('Dpad_Left', False) else 0
-        packet[45] = 255 if buttons.get('Dpad_Down', False) else 0
-        packet[46] = 255 if buttons.get('Dpad_Right', False) else 0
-        packet[47] = 255 if buttons.get('Dpad_Up', False) else 0
-        # Bytes 48-51: Analog buttons (Y/Triangle, B/Circle, A/Cross, X/Square)
-        packet[48] = 255 if buttons.get('Y', False) else 0
-        packet[49] = 255 if buttons.get('B', False) else 0
-        packet[50] = 255 if buttons.get('A', False) else 0
-        packet[51] = 255 if buttons.get('X', False) else 0
-        # Bytes 52-53: Analog R1, L1 (R, L buttons)
-        packet[52] = 255 if buttons.get('R', False) else 0
-        packet[53] = 255 if buttons.get('L', False) else 0
+        _PAD_DATA_SLOT.pack_into(packet, 20, pad_id, 2, 0x02, connection_type, _FAKE_MAC_PREFIX, pad_id,
+                                 0x05, 0x01, self.packet_counter)
+        
+        # Buttons (bytes 36-39) and analog buttons (bytes 44-53); the template leaves them all zero
+        # The four button bytes are ORed into one word and written with a single pack
+        word = 0
+        if isinstance(buttons, int):
+            # Packed: visit only the set bits
+            mask = buttons & _ALL_BUTTONS_MASK
+            while mask:
+                low = mask & -mask
+                word_bit, analog_offset = _PACKED_BUTTON_OUTPUT[low.bit_length() - 1]
+                word |= word_bit
+                if analog_offset:
+                    packet[analog_offset] = 255
+                mask ^= low
+        else:
+            get = buttons.get
+            for name, word_bit, analog_offset in _DS4_BUTTON_OUTPUT:
+                if get(name):
+                    word |= word_bit
+                    if analog_offset:
+                        packet[analog_offset] = 255
+        _U32.pack_into(packet, 36, word)
         
         # Sticks (bytes 40-43)
         # Convert from signed offset (difference from center) to 0-255 (centered at 128)
-        # Use circular normalization to ensure consistent magnitude regardless of direction
-        import math
-        
-        def normalize_stick_pair(x, y, max_range=1400.0):
-            """
-            Normalize a stick pair (x, y) using circular normalization.
-            This ensures diagonals reach the same magnitude as cardinals.
-            
-            Args:
-                x: Signed offset in X axis
-                y: Signed offset in Y axis  
-                max_range: Maximum expected range from center
-                
-            Returns:
-                Tuple of (normalized_x, normalized_y) in range -1.0 to 1.0
-            """
-            # Calculate magnitude (distance from center)
-            magnitude = math.sqrt(x * x + y * y)
-            
-            if magnitude == 0:
-                return (0.0, 0.0)
-            
-            # Normalize magnitude to 0-1 range, then clamp
-            normalized_magnitude = min(1.0, magnitude / max_range)
-            
-            # Scale both axes proportionally to maintain direction
-            # This ensures diagonals reach the same magnitude as cardinals
-            scale = normalized_magnitude / magnitude
-            normalized_x = x * scale
-            normalized_y = y * scale
-            
-            return (normalized_x, normalized_y)
-        
-        def stick_value_to_byte(normalized_value):
-            """Convert normalized value (-1.0 to 1.0) to 0-255 byte (128 is center)."""
-            return int(normalized_value * 127 + 128) & 0xFF
-        
-        main_x = sticks.get('main_x', 0)
-        main_y = sticks.get('main_y', 0)
-        c_x = sticks.get('c_x', 0)
-        c_y = sticks.get('c_y', 0)
-        
-        # Normalize each stick pair using circular normalization
-        main_norm_x, main_norm_y = normalize_stick_pair(main_x, main_y)
-        c_norm_x, c_norm_y = normalize_stick_pair(c_x, c_y)
-        
-        packet[40] = stick_value_to_byte(main_norm_x)  # Left Stick X
-        packet[41] = stick_value_to_byte(-main_norm_y)  # Left Stick Y (inverted)
-        packet[42] = stick_value_to_byte(c_norm_x)      # Right Stick X
-        packet[43] = stick_value_to_byte(-c_norm_y)     # Right Stick Y (inverted)
+        _PAD_DATA_STICKS.pack_into(packet, 40,
+                                   *_stick_pair_to_bytes(sticks.get('main_x', 0), sticks.get('main_y', 0)),  # Left Stick
+                                   *_stick_pair_to_bytes(sticks.get('c_x', 0), sticks.get('c_y', 0)))  # Right Stick
         
         # Triggers (bytes 54-55)
         # Ensure they are clamped 0-255
-        packet[54] = max(0, min(255, int(trigger_l))) & 0xFF  # L2
-        packet[55] = max(0, min(255, int(trigger_r))) & 0xFF  # R2
+        _PAD_DATA_TRIGGERS.pack_into(packet, 54, max(0, min(255, int(trigger_l))),  # L2
+                                     max(0, min(255, int(trigger_r))))  # R2
         
-        # Calculate CRC32: over whole packet (bytes 0-99) with CRC field (bytes 8-11) zeroed
-        # This matches how Pad Info packets calculate CRC
-        crc_field_backup = packet[8:12]
-        packet[8:12] = b'\x00\x00\x00\x00'
-        crc32 = self._calculate_crc32(bytes(packet))
-        packet[8:12] = crc_field_backup
-        struct.pack_into('<I', packet, 8, crc32)
+        self._finalize_crc(packet, self._pad_data_header_crc)
+        
+        # A packet carrying latched presses must be rebuilt once the latch is cleared
+        cached[0] = None if pending else state
+        cached[1] = connection_type
         
         # Clear the latch for this pad after creating the packet
-        if pad_id in self.pending_presses_by_slot:
-            self.pending_presses_by_slot[pad_id].clear()
+        if pending:
+            pending.clear()
         
-        return bytes(packet)
+        return packet
     
     def _respond_version(self, data, addr):
         """Respond to version request immediately."""
         packet = self._version_buffer
-        packet[:] = b'\x00' * 24  # Clear buffer
-        # Header: "DSUS" (server response)
-        packet[0:4] = b'DSUS'
-        # Protocol version: 1001
-        struct.pack_into('<H', packet, 4, self.PROTOCOL_VERSION)
-        # Packet length: 8 (4 bytes type + 2 bytes version + 2 bytes padding)
-        struct.pack_into('<H', packet, 6, 8)
         # Server ID (copy from request if present, otherwise use default)
         if len(data) >= 16:
-            server_id = struct.unpack('<I', data[12:16])[0]
+            server_id = _U32.unpack_from(data, 12)[0]
         else:
             server_id = self.server_id
-        struct.pack_into('<I', packet, 12, server_id)
-        # Message type: 0x1000000
-        struct.pack_into('<I', packet, 16, self.PACKET_TYPE_VERSION)
+        # Header: "DSUS" (server response), protocol version 1001, packet length 8 (4 bytes type +
+        # 2 bytes version + 2 bytes padding), CRC placeholder, server ID, message type 0x1000000
+        _HEADER.pack_into(packet, 0, b'DSUS', self.PROTOCOL_VERSION, 8, 0, server_id, self.PACKET_TYPE_VERSION)
         # Version: 1001
-        struct.pack_into('<H', packet, 20, self.PROTOCOL_VERSION)
+        _U16.pack_into(packet, 20, self.PROTOCOL_VERSION)
         # Padding
         packet[22:24] = b'\x00\x00'
-        # Calculate CRC32: over whole packet (bytes 0-23) with CRC field (bytes 8-11) zeroed
-        crc_field_backup = packet[8:12]
-        packet[8:12] = b'\x00\x00\x00\x00'
-        crc = self._calculate_crc32(bytes(packet))
-        packet[8:12] = crc_field_backup
-        struct.pack_into('<I', packet, 8, crc)
-        self.socket.sendto(bytes(packet), addr)
+        self._finalize_crc(packet)
+        self.socket.sendto(packet, addr)
     
     def _respond_pad_info(self, data, addr):
         """Respond to pad info request immediately."""
         try:
             if len(data) >= 24:
-                num_slots = struct.unpack('<i', data[20:24])[0]
-                slots_to_report = [data[24+i] for i in range(num_slots)] if len(data) >= 24 + num_slots else [0]
-                req_server_id = struct.unpack('<I', data[12:16])[0] if len(data) >= 16 else self.server_id
-                connected_slots = set(self.last_state_by_slot.keys())
+                num_slots = _I32.unpack_from(data, 20)[0]
+                # Iterating the bytes slice yields the slot ids directly (no per-slot indexing)
+                if num_slots < 0:
+                    slots_to_report = b''
+                elif len(data) >= 24 + num_slots:
+                    slots_to_report = data[24:24 + num_slots]
+                else:
+                    slots_to_report = b'\x00'
+                req_server_id = _U32.unpack_from(data, 12)[0] if len(data) >= 16 else self.server_id
+                connected_slots = self.last_state_by_slot
                 
+                cache = self._pad_info_cache
+                sendto = self.socket.sendto
                 for slot_id in slots_to_report:
                     is_connected = slot_id in connected_slots
                     conn_type = self._get_connection_type_for_slot(slot_id)
-                    packet = self._create_pad_info_packet(
-                        pad_id=slot_id, connected=is_connected, server_id=req_server_id,
-                        connection_type=conn_type
-                    )
-                    self.socket.sendto(packet, addr)
+                    # Pad info only depends on these inputs, so each distinct answer is built once
+                    key = (slot_id, req_server_id, is_connected, conn_type)
+                    packet = cache.get(key)
+                    if packet is None:
+                        if len(cache) >= self.PAD_INFO_CACHE_MAX:
+                            cache.clear()
+                        packet = cache[key] = bytes(self._create_pad_info_packet(
+                            pad_id=slot_id, connected=is_connected, server_id=req_server_id,
+                            connection_type=conn_type
+                        ))
+                    # One datagram per slot: DSU clients expect a separate response for each
+                    sendto(packet, addr)
         except Exception:
             pass  # Silently ignore pad info errors
     
     def _get_connection_type_for_slot(self, slot_id: int) -> int:
-        """Return 0x01=USB or 0x02=BLE for slot. Stored in state as 'connection_type' or default USB."""
-        state = self.last_state_by_slot.get(slot_id)
-        if state and isinstance(state.get('connection_type'), int):
-            return state['connection_type']
-        return 0x01
+        """Return 0x01=USB or 0x02=BLE for slot, as last passed to update(); default USB."""
+        return self._connection_type_by_slot.get(slot_id, 0x01)
     
     def update(self, state: Dict, pad_id: int = 0, connection_type: int = 0x01):
         """
@@ -503,13 +590,14 @@ class DSUServer:
         Tracks button presses in a latch to ensure quick taps aren't dropped.
         
         Args:
-            state: Dictionary containing buttons, sticks, triggers
+            state: Dictionary containing buttons, sticks, triggers. buttons is a {name: bool} dict
+                or an int packed per BUTTON_MASKS
             pad_id: DSU slot (0-3) this controller maps to
             connection_type: 0x01=USB, 0x02=Bluetooth (for pad info display)
         """
-        # Store connection type in state for pad info responses
-        state_with_meta = dict(state)
-        state_with_meta['connection_type'] = connection_type
+        # Connection type is kept beside the state (for pad info responses) so the state is stored
+        # as-is: drivers publish a new dict per report and never mutate it, so no copy is needed
+        self._connection_type_by_slot[pad_id] = connection_type
         
         # Check for new presses and add them to the latch
         if 'parsed' in state:
@@ -517,12 +605,22 @@ class DSUServer:
         else:
             btns = state.get('buttons', {})
         
-        pending = self.pending_presses_by_slot.setdefault(pad_id, set())
-        for btn, pressed in btns.items():
-            if pressed:
-                pending.add(btn)
-        
-        self.last_state_by_slot[pad_id] = state_with_meta
+        # Skip the scan when nothing is held, or for the same buttons as last time: their presses
+        # were latched already and stay visible in the stored state while held
+        if isinstance(btns, int):
+            if btns and btns != self._latched_buttons_by_slot.get(pad_id):
+                pending = self.pending_presses_by_slot.setdefault(pad_id, set())
+                for name, mask in BUTTON_MASKS.items():
+                    if btns & mask:
+                        pending.add(name)
+        elif btns is not self._latched_buttons_by_slot.get(pad_id) and any(btns.values()):
+            pending = self.pending_presses_by_slot.setdefault(pad_id, set())
+            for btn, pressed in btns.items():
+                if pressed:
+                    pending.add(btn)
+        self._latched_buttons_by_slot[pad_id] = btns
+        
+        self.last_state_by_slot[pad_id] = state
     
     def register_rumble_callback(self, pad_id: int, callback: Callable[[int, int], None]):
         """Register a rumble callback for a pad. Called when Dolphin sends rumble (0x110002)."""
@@ -532,7 +630,7 @@ class DSUServer:
         """Unregister rumble callback when driver stops."""
         self._rumble_callbacks.pop(pad_id, None)
 
-    def _handle_rumble(self, data: bytes):
+    def _handle_rumble(self, data: bytes, addr=None):
         """Handle rumble packet (0x110002). Payload at offset 20: flags, slot, pad, motor_id, intensity."""
         if len(data) < 30:
             return
@@ -581,54 +679,111 @@ class DSUServer:
                 except Exception:
                     pass
     
+    def _broadcast_pad_data(self, client_items: tuple):
+        """Send each slot's pad data to every client subscribed to it. A slot's packet is built
+        once per broadcast and the same bytes go to all of its clients.
+        client_items: ((addr, requested_slots), ...) snapshot of the subscribed clients."""
+        sendto = self.socket.sendto
+        for pad_id, state in list(self.last_state_by_slot.items()):
+            packet = None
+            for client_addr, requested_slots in client_items:
+                if pad_id not in requested_slots:
+                    continue
+                if packet is None:
+                    try:
+                        conn_type = self._get_connection_type_for_slot(pad_id)
+                        packet = self._create_pad_data_packet(state, pad_id=pad_id, connection_type=conn_type)
+                    except Exception:
+                        break  # Unbuildable state: skip this slot this tick, still serve the others
+                try:
+                    sendto(packet, client_addr)
+                except Exception:
+                    pass
+    
+    def _respond_pad_data(self, data, addr):
+        """Subscribe the client to the requested slots (for the broadcast) and answer immediately."""
+        requested_slots = self._get_requested_slots(data)
+        if self._clients.get(addr) != requested_slots:
+            self._clients[addr] = requested_slots
+            self._client_items = tuple(self._clients.items())
+        self._send_pad_data_to_client(addr, requested_slots)
+        if addr not in self._logged_clients:
+            print(f"✓ Dolphin connected", flush=True)
+            self._logged_clients.add(addr)
+    
+    def _datagram_received(self, data: bytes, addr):
+        """Handle one client request: dispatch it by message type to its handler."""
+        if len(data) < 20:
+            return
+        magic, msg_type = _REQUEST_KIND.unpack_from(data)
+        if magic != b'DSUC':
+            return
+        handler = self._request_handlers.get(msg_type)
+        if handler is not None:
+            handler(data, addr)
+    
     def handle_requests(self):
-        """Handle incoming DSU client requests (runs in background thread). Prioritizes reactive mode."""
-        # clients[addr] = set of slot ids they requested
-        clients: Dict[tuple, set] = {}
-        last_update_time = 0
-        update_interval = 1.0 / 1000.0  # 1000Hz = 1ms for maximum responsiveness
+        """Handle incoming DSU client requests (runs in background thread). Prioritizes reactive mode:
+        waits on the socket until a request arrives or the next broadcast is due, so replies go out
+        as soon as a request lands and broadcasts keep a steady cadence. With no subscribed clients
+        it blocks until a request arrives (stop() wakes it through the wakeup socket pair)."""
+        raise_current_thread_priority(self.HANDLER_THREAD_RT_PRIORITY)
+        self._clients.clear()
+        self._client_items = ()
+        interval = self.BROADCAST_INTERVAL_SEC
+        next_broadcast = time.monotonic() + interval
+        selector = selectors.DefaultSelector()
+        sock = self.socket
+        try:
+            selector.register(sock, selectors.EVENT_READ)
+            if self._wakeup_recv:
+                selector.register(self._wakeup_recv, selectors.EVENT_READ)
+        except (AttributeError, ValueError, OSError):
+            selector.close()
+            return
         
-        while self.running:
-            if not self.socket:
-                break
-            
-            try:
-                # Use socket timeout to wake thread IMMEDIATELY when packet arrives (reactive mode)
-                data, addr = self.socket.recvfrom(1024)
+        # Bound once: the socket is fixed for this thread's lifetime (stop() joins before closing it)
+        select = selector.select
+        recvfrom = sock.recvfrom
+        monotonic = time.monotonic
+        datagram_received = self._datagram_received
+        broadcast = self._broadcast_pad_data
+        states = self.last_state_by_slot
+        batch_max = self.RECV_BATCH_MAX
+        
+        try:
+            while self.running:
+                try:
+                    if self._client_items:
+                        timeout = next_broadcast - monotonic()
+                    else:
+                        timeout = None  # Nobody to broadcast to: sleep until a request arrives (or stop())
+                    if (timeout is None or timeout > 0) and select(timeout):
+                        # Drain what is already queued so a burst of requests costs one wakeup (bounded,
+                        # so a flood can't hold off the broadcast). A stop() wakeup finds nothing to read
+                        for _ in range(batch_max):
+                            try:
+                                data, addr = recvfrom(1024)
+                            except BlockingIOError:
+                                break
+                            datagram_received(data, addr)
+                    
+                    now = monotonic()
+                    if now >= next_broadcast:
+                        # Schedule the next tick first, so a broadcast that raises costs one tick instead
+                        # of leaving the deadline in the past (which would skip select() and spin)
+                        next_broadcast += interval
+                        if next_broadcast <= now:  # Fell behind (e.g. thread descheduled): don't burst to catch up
+                            next_broadcast = now + interval
+                        client_items = self._client_items
+                        if client_items and states:
+                            broadcast(client_items)
                 
-                if data and len(data) >= 20:
-                    magic = data[0:4]
-                    if magic == b'DSUC':
-                        msg_type = struct.unpack('<I', data[16:20])[0]
-                        
-                        if msg_type == self.PACKET_TYPE_VERSION:
-                            self._respond_version(data, addr)
-                        
-                        elif msg_type == self.PACKET_TYPE_PAD_INFO:
-                            self._respond_pad_info(data, addr)
-                        
-                        elif msg_type == self.PACKET_TYPE_PAD_DATA:
-                            requested_slots = self._get_requested_slots(data)
-                            clients[addr] = requested_slots
-                            self._send_pad_data_to_client(addr, requested_slots)
-                            if addr not in self._logged_clients:
-                                print(f"✓ Dolphin connected", flush=True)
-                                self._logged_clients.add(addr)
-
-                        elif msg_type == self.PACKET_TYPE_RUMBLE:
-                            self._handle_rumble(data)
-            
-            except socket.timeout:
-                current_time = time.time()
-                if clients and self.last_state_by_slot and (current_time - last_update_time) >= update_interval:
-                    for client_addr, requested_slots in list(clients.items()):
-                        try:
-                            self._send_pad_data_to_client(client_addr, requested_slots)
-                        except Exception:
-                            clients.pop(client_addr, None)
-                    last_update_time = current_time
-            
-            except OSError:
-                break
-            except Exception:
-                pass
+                except BlockingIOError:
+                    pass  # Nothing to read after all, or a send buffer was full (packet dropped)
+                except (OSError, ValueError):
+                    break  # Socket closed by stop()
+                except Exception:
+                    pass
+        finally:
+            selector.close()
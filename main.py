@@ -12,8 +12,10 @@ import time
 import sys
 import threading
 import asyncio
+import json
 import queue
-from collections import deque
+from collections import Counter, deque
+from datetime import datetime
 
 # Optional BLE support (for wireless controller not visible as HID)
 try:
@@ -24,6 +26,20 @@ except ImportError:
     BleakClient = None
     BleakScanner = None
 
+# Optional: orjson serializes log entries straight to bytes, much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _log_line(entry) -> bytes:
+    """One JSON Lines record (UTF-8, trailing newline) for the --log file."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + '\n').encode('utf-8')
+
+
 # Retry interval when waiting for controller to become connectable (seconds)
 BLE_CONNECT_RETRY_SEC = 2.0
 # How long to scan when using --ble-scan (seconds)
@@ -39,12 +55,15 @@ BLE_CONN_MIN_INTERVAL_UNITS = 6   # 7.5ms
 BLE_CONN_MAX_INTERVAL_UNITS = 12  # 15ms
 # Import DSU server support
 try:
-    from dsu_server import DSUServer
+    from dsu_server import DSUServer, raise_current_thread_priority
     DSU_AVAILABLE = True
 except ImportError:
     DSU_AVAILABLE = False
     DSUServer = None
 
+    def raise_current_thread_priority(rt_priority, policy='SCHED_RR'):
+        pass
+
 # Try to import GUI libraries
 GUI_AVAILABLE = False
 GUI_TYPE = None
@@ -86,6 +105,21 @@ except ImportError:
 VID = 0x057e
 PID = 0x2073
 INTERFACE_NUM = 1
+# Max log entries waiting for the writer thread before new ones are dropped
+LOG_QUEUE_MAX = 1024
+# Write buffer for the --log file (entries are flushed when the writer's queue runs empty)
+LOG_WRITE_BUFFER_BYTES = 1 << 16
+# read_loop waits this long in hidapi for the next report (the device is non-blocking otherwise,
+# so queued reports are drained without waiting). Short enough to notice stop() promptly.
+HID_READ_TIMEOUT_MS = 4
+# Per-sample wait while collecting stick calibration samples at startup
+HID_CALIBRATION_READ_TIMEOUT_MS = 20
+# USB reports at least this long carry sticks and both analog triggers (bytes 6-14)
+USB_FULL_REPORT_LEN = 15
+# Terminal mode: print repeated read errors at most this often
+READ_ERROR_PRINT_INTERVAL_SEC = 1.0
+# stop() waits this long for read_loop to leave hidapi before closing the device
+READ_THREAD_JOIN_TIMEOUT_SEC = 1.0
 
 # Nintendo BLE: standard HID Report characteristic (read = notifications, write = output/command)
 HID_REPORT_UUID = "00002a4d-0000-1000-8000-00805f9b34fb"
@@ -99,10 +133,18 @@ BLE_HANDSHAKE_READ_SPI = bytearray([
 ])
 
 # Initialization data discovered by the community
-DEFAULT_REPORT_DATA = [
+DEFAULT_REPORT_DATA = bytes([
     0x03, 0x91, 0x00, 0x0d, 0x00, 0x08,
     0x00, 0x00, 0x01, 0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF
-]
+])
+
+# USB report button names in report bit order (byte 3 bits 0-6, byte 4 bits 0-5, byte 5 bits 0-1)
+USB_BUTTON_NAMES = (
+    'B', 'A', 'Y', 'X', 'R', 'Z', 'Start',
+    'Dpad_Down', 'Dpad_Right', 'Dpad_Left', 'Dpad_Up', 'L', 'ZL',
+    'Home', 'Capture',
+)
+_USB_BUTTONS_RELEASED = dict.fromkeys(USB_BUTTON_NAMES, False)
 
 # Player indicator LED masks (per NSO-GameCube-Controller-Pairing-App / BlueRetro protocol)
 # Player 1=0x01, 2=0x03, 3=0x05, 4=0x06
@@ -133,6 +175,15 @@ SET_LED_DATA = build_led_data_usb(0)
 # Subcommand 0x03: Set Input Mode — 0x30 = standard full reports (max report rate for dash dancing / short hops)
 SET_INPUT_MODE = bytearray([0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x30])
 
+def _median(vals):
+    """Upper median of an iterable of ints (stick calibration)."""
+    srt = sorted(vals)
+    return srt[len(srt) // 2]
+
+
+# Raw 12-bit stick centers (main_x, main_y, c_x, c_y) assumed before calibration: 2^11
+STICK_CENTERS_DEFAULT = (2048, 2048, 2048, 2048)
+
 # Rumble command: 0x0A = vibration, 0x91, interface 0x00 (USB) or 0x01 (BLE)
 def build_rumble_cmd_usb(state: bool) -> bytes:
     return bytes([0x0A, 0x91, 0x00, 0x02, 0x00, 0x04,
@@ -145,6 +196,11 @@ def build_rumble_cmd_ble(state: bool) -> bytes:
                   0x00, 0x00, 0x00])
 
 
+# SCHED_FIFO priority for the USB read thread (Linux). Low end of the RT range: above every
+# normal process, below the kernel's IRQ threads (50) so USB interrupts are still serviced first.
+READ_THREAD_RT_PRIORITY = 10
+
+
 class NSODriver:
     """NSO GameCube Controller Driver."""
     
@@ -153,14 +209,25 @@ class NSODriver:
         self.usb_device = None
         self.hid_device = None
         self.running = False
+        # Thread running read_loop; stop() joins it so the device is never closed mid-read
+        self._read_thread = None
         self.out_endpoint = None
+        self._out_ep = None  # usb.core.Endpoint for out_endpoint
         self.use_gui = use_gui and GUI_AVAILABLE
+        # Latest parsed report. Written only by the input thread, always as a new dict that is never
+        # mutated afterwards, so readers on other threads get a consistent snapshot by reading it once.
         self.current_state = None
+        # Set by the input thread after each new current_state; the GUI clears it when it redraws
+        self.state_dirty = False
         self.gui_window = None
         self.log_file = log_file
         self.debug = debug
-        self.last_log_time = 0
+        # parse_input adds raw/offset stick fields only when logging or debugging
+        self._stick_debug = bool(log_file or debug)
+        self.last_log_time = float('-inf')  # perf_counter() of the last logged sample
         self.log_interval = 1.0  # Log every 1 second
+        self._log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        self._log_writer_started = False
         self.dsu_pad_id = dsu_pad_id
         self.dsu_connection_type = dsu_connection_type
         self.device_index = device_index
@@ -175,14 +242,14 @@ class NSODriver:
         else:
             self.dsu_server = None
         
-        # Calibration offsets (assume controller starts in neutral position)
-        self.calibration = {
-            'main_x_center': None,
-            'main_y_center': None,
-            'c_x_center': None,
-            'c_y_center': None,
-            'calibrated': False
-        }
+        # Calibration offsets (assume controller starts in neutral position).
+        # stick_centers is (main_x, main_y, c_x, c_y); replaced as a whole so readers on other threads
+        # always see a consistent set. Parsers unpack it once per report.
+        self.stick_centers = STICK_CENTERS_DEFAULT
+        self.calibrated = False
+        # Last USB button bits and the dict built for them (reused while buttons are unchanged)
+        self._usb_button_word = None
+        self._usb_buttons = None
         self._init_latency_monitor()
 
     def _init_latency_monitor(self):
@@ -190,9 +257,9 @@ class NSODriver:
         self._last_packet_time = None
         self._iat_history = deque(maxlen=100)  # last 100 packets
 
-    def _log_latency(self):
-        """Log IAT stats every 100 packets. Avg 8–10ms = excellent; >20ms = dash dancing suffers."""
-        current_time = time.perf_counter()
+    def _log_latency(self, current_time):
+        """Log IAT stats every 100 packets. Avg 8–10ms = excellent; >20ms = dash dancing suffers.
+        current_time: time.perf_counter() taken when the report arrived (shared with log_sample)."""
         if self._last_packet_time is not None:
             delta = (current_time - self._last_packet_time) * 1000
             self._iat_history.append(delta)
@@ -228,10 +295,13 @@ class NSODriver:
         cfg = self.usb_device.get_active_configuration()
         intf = cfg[(INTERFACE_NUM, 0)]
         self.out_endpoint = None
+        self._out_ep = None
         for ep in intf:
             if usb.util.endpoint_direction(ep.bEndpointAddress) == usb.util.ENDPOINT_OUT:
                 if (ep.bmAttributes & 0x03) == usb.util.ENDPOINT_TYPE_BULK:
                     self.out_endpoint = ep.bEndpointAddress
+                    # Keep the Endpoint itself: ep.write() skips pyusb's address -> endpoint lookup
+                    self._out_ep = ep
                     break
         
         if self.out_endpoint is None:
@@ -245,11 +315,7 @@ class NSODriver:
         
         # Send default report
         try:
-            transferred = self.usb_device.write(
-                self.out_endpoint,
-                DEFAULT_REPORT_DATA,
-                timeout=1000
-            )
+            transferred = self._out_ep.write(DEFAULT_REPORT_DATA, timeout=1000)
             print(f"  ✓ Default report sent ({transferred} bytes)")
         except Exception as e:
             print(f"  ✗ Error sending default report: {e}")
@@ -257,11 +323,7 @@ class NSODriver:
         # Send LED report (player indicator for port/slot)
         try:
             led_data = build_led_data_usb(self.dsu_pad_id)
-            transferred = self.usb_device.write(
-                self.out_endpoint,
-                led_data,
-                timeout=1000
-            )
+            transferred = self._out_ep.write(led_data, timeout=1000)
             print(f"  ✓ LED report sent ({transferred} bytes)")
         except Exception as e:
             print(f"  ✗ Error sending LED report: {e}")
@@ -287,7 +349,7 @@ class NSODriver:
     
     def calibrate_sticks(self, num_samples=10):
         """Calibrate stick centers by reading initial values (assumes neutral position)."""
-        if self.calibration['calibrated']:
+        if self.calibrated:
             return True
         
         print("Calibrating sticks (assuming neutral position)...")
@@ -296,15 +358,15 @@ class NSODriver:
         # Collect samples
         for _ in range(num_samples):
             try:
-                data = self.hid_device.read(64)
+                data = self.hid_device.read(64, HID_CALIBRATION_READ_TIMEOUT_MS)
                 if data and len(data) >= 12:
                     # Extract 12-bit values using nibble packing (same as parse_input)
-                    samples.append({
-                        'main_x': data[6] | ((data[7] & 0x0F) << 8),
-                        'main_y': (data[7] >> 4) | (data[8] << 4),
-                        'c_x': data[9] | ((data[10] & 0x0F) << 8),
-                        'c_y': (data[10] >> 4) | (data[11] << 4),
-                    })
+                    samples.append((
+                        data[6] | ((data[7] & 0x0F) << 8),
+                        (data[7] >> 4) | (data[8] << 4),
+                        data[9] | ((data[10] & 0x0F) << 8),
+                        (data[10] >> 4) | (data[11] << 4),
+                    ))
             except:
                 pass
         
@@ -312,18 +374,20 @@ class NSODriver:
             print("  ✗ Not enough samples for calibration")
             return False
         
-        # Calculate average (median might be better, but average is simpler)
-        self.calibration['main_x_center'] = int(sum(s['main_x'] for s in samples) / len(samples))
-        self.calibration['main_y_center'] = int(sum(s['main_y'] for s in samples) / len(samples))
-        self.calibration['c_x_center'] = int(sum(s['c_x'] for s in samples) / len(samples))
-        self.calibration['c_y_center'] = int(sum(s['c_y'] for s in samples) / len(samples))
-        self.calibration['calibrated'] = True
+        # Per-axis median: one pass over each axis, and a stray sample taken mid-movement can't skew it
+        main_x, main_y, c_x, c_y = (_median(axis) for axis in zip(*samples))
+        self.set_stick_centers(main_x, main_y, c_x, c_y)
         
         print(f"  ✓ Calibration complete:")
-        print(f"    Main stick center: X={self.calibration['main_x_center']}, Y={self.calibration['main_y_center']}")
-        print(f"    C-stick center: X={self.calibration['c_x_center']}, Y={self.calibration['c_y_center']}")
+        print(f"    Main stick center: X={main_x}, Y={main_y}")
+        print(f"    C-stick center: X={c_x}, Y={c_y}")
         return True
     
+    def set_stick_centers(self, main_x, main_y, c_x, c_y):
+        """Install measured stick centers (raw 12-bit values) and mark sticks calibrated."""
+        self.stick_centers = (main_x, main_y, c_x, c_y)
+        self.calibrated = True
+
     def parse_input(self, data, report_id_offset=0, ble_layout=False):
         """Parse HID input data based on discovered format.
 
@@ -358,23 +422,18 @@ class NSODriver:
             }
         else:
             # USB: original discovered format (do not change)
-            buttons = {
-                'B': (data[3 + o] & 0x01) != 0,
-                'A': (data[3 + o] & 0x02) != 0,
-                'Y': (data[3 + o] & 0x04) != 0,
-                'X': (data[3 + o] & 0x08) != 0,
-                'R': (data[3 + o] & 0x10) != 0,
-                'Z': (data[3 + o] & 0x20) != 0,
-                'Start': (data[3 + o] & 0x40) != 0,
-                'Dpad_Down': (data[4 + o] & 0x01) != 0,
-                'Dpad_Right': (data[4 + o] & 0x02) != 0,
-                'Dpad_Left': (data[4 + o] & 0x04) != 0,
-                'Dpad_Up': (data[4 + o] & 0x08) != 0,
-                'L': (data[4 + o] & 0x10) != 0,
-                'ZL': (data[4 + o] & 0x20) != 0,
-                'Home': (data[5 + o] & 0x01) != 0,
-                'Capture': (data[5 + o] & 0x02) != 0,
-            }
+            b3, b4, b5 = data[3 + o], data[4 + o], data[5 + o]
+            button_word = (b3 & 0x7F) | ((b4 & 0x3F) << 8) | ((b5 & 0x03) << 16)
+            if button_word == self._usb_button_word:
+                # Unchanged since the last report: reuse the dict (parsed state is read-only for consumers)
+                buttons = self._usb_buttons
+            elif not button_word:
+                # Common case: nothing held. Copying the prebuilt dict is far cheaper than 15 bit tests.
+                buttons = dict(_USB_BUTTONS_RELEASED)
+            else:
+                buttons = self._usb_buttons_from_bytes(b3, b4, b5)
+            self._usb_button_word = button_word
+            self._usb_buttons = buttons
 
         # Analog triggers (bytes 13 and 14) - restore original working positions
         trigger_l = data[13 + o] if len(data) > 13 + o else 0
@@ -397,46 +456,36 @@ class NSODriver:
         # 2. Subtract calibration center (typically 2048 = 2^11) to get offset from neutral
         # 3. Result is signed integer (-2048 to +2047), no wrapping needed
 
-        if len(data) >= 12 + o:
-            # STEP 1: Extract 12-bit values from nibble-packed bytes
-            # Main Stick (Left Stick) extraction
-            # Byte 6: Lower 8 bits of X
-            # Byte 7: Upper 4 bits of X (low nibble), Lower 4 bits of Y (high nibble)
-            # Byte 8: Upper 8 bits of Y
-            main_x_raw = data[6 + o] | ((data[7 + o] & 0x0F) << 8)
-            main_y_raw = (data[7 + o] >> 4) | (data[8 + o] << 4)
-
-            # C-Stick (Right Stick) extraction
-            # Byte 9: Lower 8 bits of X
-            # Byte 10: Upper 4 bits of X (low nibble), Lower 4 bits of Y (high nibble)
-            # Byte 11: Upper 8 bits of Y
-            c_x_raw = data[9 + o] | ((data[10 + o] & 0x0F) << 8)
-            c_y_raw = (data[10 + o] >> 4) | (data[11 + o] << 4)
-
-            # STEP 2: Apply calibration - subtract center to get offset from neutral
-            if self.calibration['calibrated']:
-                # Subtract measured center (12-bit value, typically around 2048)
-                main_x = main_x_raw - self.calibration['main_x_center']
-                main_y = main_y_raw - self.calibration['main_y_center']
-                c_x = c_x_raw - self.calibration['c_x_center']
-                c_y = c_y_raw - self.calibration['c_y_center']
-            else:
-                # Fallback: assume 2048 is center (2^11, middle of 12-bit range)
-                main_x = main_x_raw - 2048
-                main_y = main_y_raw - 2048
-                c_x = c_x_raw - 2048
-                c_y = c_y_raw - 2048
-
-            # STEP 3: Final output (no Y inversion needed - controller already outputs correct direction)
-            sticks = {
-                # Main stick: Use calibrated values directly
-                'main_x': main_x,
-                'main_y': main_y,  # No inversion needed
-
-                # C-stick: Use calibrated values directly
-                'c_x': c_x,
-                'c_y': c_y,  # No inversion needed
-
+        # STEP 1: Extract 12-bit values from nibble-packed bytes (length already checked above).
+        # Read each byte once into a local: bytes 7 and 10 carry a nibble of both axes.
+        b6, b7, b8 = data[6 + o], data[7 + o], data[8 + o]
+        b9, b10, b11 = data[9 + o], data[10 + o], data[11 + o]
+        # Main Stick (Left Stick): byte 6 = low 8 bits of X, byte 7 = X high nibble | Y low nibble, byte 8 = high 8 bits of Y
+        main_x_raw = b6 | ((b7 & 0x0F) << 8)
+        main_y_raw = (b7 >> 4) | (b8 << 4)
+        # C-Stick (Right Stick): same packing in bytes 9-11
+        c_x_raw = b9 | ((b10 & 0x0F) << 8)
+        c_y_raw = (b10 >> 4) | (b11 << 4)
+
+        # STEP 2: Apply calibration - subtract center to get offset from neutral
+        # (measured centers once calibrated, else 2048 = 2^11, middle of the 12-bit range)
+        main_cx, main_cy, c_cx, c_cy = self.stick_centers
+        main_x = main_x_raw - main_cx
+        main_y = main_y_raw - main_cy
+        c_x = c_x_raw - c_cx
+        c_y = c_y_raw - c_cy
+
+        # STEP 3: Final output (no Y inversion needed - controller already outputs correct direction)
+        sticks = {
+            # Main stick / C-stick: calibrated values
+            'main_x': main_x,
+            'main_y': main_y,
+            'c_x': c_x,
+            'c_y': c_y,
+        }
+        # Debug fields only when asked for, or while uncalibrated (BLE calibrates from the *_raw values)
+        if self._stick_debug or not self.calibrated:
+            sticks.update({
                 # Store raw 12-bit values for debugging
                 'main_x_raw': main_x_raw,
                 'main_y_raw': main_y_raw,
@@ -451,15 +500,10 @@ class NSODriver:
 
                 # Raw bytes for debugging
                 'raw_bytes': {
-                    'main': [data[6 + o], data[7 + o], data[8 + o]],
-                    'c': [data[9 + o], data[10 + o], data[11 + o]],
+                    'main': [b6, b7, b8],
+                    'c': [b9, b10, b11],
                 },
-            }
-        else:
-            # Fallback
-            sticks = {
-                'main_x': 0, 'main_y': 0, 'c_x': 0, 'c_y': 0,
-            }
+            })
 
         return {
             'buttons': buttons,
@@ -469,21 +513,70 @@ class NSODriver:
             'raw': data
         }
 
-    def _stick_12bit_from_bytes(self, b0, b1, b2):
-        """Decode 12-bit nibble-packed stick axis from 3 bytes (Nintendo standard)."""
-        x_raw = b0 | ((b1 & 0x0F) << 8)
-        y_raw = (b1 >> 4) | (b2 << 4)
-        return x_raw, y_raw
+    def _usb_buttons_from_bytes(self, b3, b4, b5):
+        """USB button bits (discovered format, bytes 3-5) -> buttons dict."""
+        return {
+            'B': (b3 & 0x01) != 0,
+            'A': (b3 & 0x02) != 0,
+            'Y': (b3 & 0x04) != 0,
+            'X': (b3 & 0x08) != 0,
+            'R': (b3 & 0x10) != 0,
+            'Z': (b3 & 0x20) != 0,
+            'Start': (b3 & 0x40) != 0,
+            'Dpad_Down': (b4 & 0x01) != 0,
+            'Dpad_Right': (b4 & 0x02) != 0,
+            'Dpad_Left': (b4 & 0x04) != 0,
+            'Dpad_Up': (b4 & 0x08) != 0,
+            'L': (b4 & 0x10) != 0,
+            'ZL': (b4 & 0x20) != 0,
+            'Home': (b5 & 0x01) != 0,
+            'Capture': (b5 & 0x02) != 0,
+        }
+
+    def _parse_usb_report(self, data):
+        """parse_input() specialized for full-length USB reports (>= USB_FULL_REPORT_LEN bytes, no
+        report ID offset): no length checks or index offsets. read_loop switches to this once it has
+        seen a full-length report and keeps using it while the length stays the same.
+        Same output as parse_input(); the debug stick fields are left to parse_input."""
+        if self._stick_debug or not self.calibrated:
+            return self.parse_input(data)
+
+        b3, b4, b5 = data[3], data[4], data[5]
+        button_word = (b3 & 0x7F) | ((b4 & 0x3F) << 8) | ((b5 & 0x03) << 16)
+        if button_word == self._usb_button_word:
+            buttons = self._usb_buttons
+        else:
+            if not button_word:
+                buttons = dict(_USB_BUTTONS_RELEASED)
+            else:
+                buttons = self._usb_buttons_from_bytes(b3, b4, b5)
+            self._usb_button_word = button_word
+            self._usb_buttons = buttons
 
-    def log_sample(self, data_list, parsed):
-        """Log a sample to file with all interpretations."""
-        import json
-        from datetime import datetime
+        # 12-bit nibble-packed sticks (see parse_input), minus the calibrated centers
+        b7, b10 = data[7], data[10]
+        main_cx, main_cy, c_cx, c_cy = self.stick_centers
+        return {
+            'buttons': buttons,
+            'trigger_l': data[13],
+            'trigger_r': data[14],
+            'sticks': {
+                'main_x': (data[6] | ((b7 & 0x0F) << 8)) - main_cx,
+                'main_y': ((b7 >> 4) | (data[8] << 4)) - main_cy,
+                'c_x': (data[9] | ((b10 & 0x0F) << 8)) - c_cx,
+                'c_y': ((b10 >> 4) | (data[11] << 4)) - c_cy,
+            },
+            'raw': data
+        }
+
+    def log_sample(self, data_list, parsed, current_time):
+        """Log a sample to file with all interpretations.
+        current_time: time.perf_counter() of the report, used only to rate-limit to log_interval.
+        Only builds the entry; the file write happens on the log writer thread (see _log_writer)."""
         
         if not self.log_file:
             return
         
-        current_time = time.time()
         if current_time - self.last_log_time < self.log_interval:
             return
         
@@ -494,11 +587,11 @@ class NSODriver:
             'timestamp': datetime.now().isoformat(),
             'raw_bytes': {
                 'all': data_list[:20],  # First 20 bytes
-                'stick_region': {
-                    'bytes_6_7': [data_list[6], data_list[7]],
-                    'bytes_8_9': [data_list[8], data_list[9]],
-                    'bytes_10_11': [data_list[10], data_list[11]],
-                    'bytes_12_13': [data_list[12], data_list[13]],
+                'stick_region': {  # slices: short BLE reports must not raise on the read thread
+                    'bytes_6_7': data_list[6:8],
+                    'bytes_8_9': data_list[8:10],
+                    'bytes_10_11': data_list[10:12],
+                    'bytes_12_13': data_list[12:14],
                 }
             },
             'interpretations': {
@@ -508,16 +601,6 @@ class NSODriver:
                     'c_x': parsed['sticks'].get('c_x', 0),
                     'c_y': parsed['sticks'].get('c_y', 0),
                 },
-                'alternative': {
-                    'main_x_alt': parsed['sticks'].get('main_x_alt', 0),
-                    'main_y_alt': parsed['sticks'].get('main_y_alt', 0),
-                },
-                '16bit_le': {
-                    'main_x': parsed['sticks'].get('main_x_16_le', 0),
-                    'main_y': parsed['sticks'].get('main_y_16_le', 0),
-                    'c_x': parsed['sticks'].get('c_x_16_le', 0),
-                    'c_y': parsed['sticks'].get('c_y_16_le', 0),
-                }
             },
             'buttons': {k: v for k, v in parsed['buttons'].items() if v},
             'triggers': {
@@ -526,68 +609,108 @@ class NSODriver:
             }
         }
         
-        # Append to log file (JSON Lines format)
+        # Hand off to the writer thread; never block input handling on file I/O (drop if backed up)
+        if not self._log_writer_started:
+            self._log_writer_started = True
+            threading.Thread(target=self._log_writer, daemon=True).start()
+        try:
+            self._log_queue.put_nowait(log_entry)
+        except queue.Full:
+            pass
+
+    def _log_writer(self):
+        """Append queued log entries to the log file (JSON Lines format). Keeps the file open in
+        buffered binary mode: entries are serialized straight to bytes (orjson when installed), and
+        flushed once the queue is drained, so a killed driver loses at most the current batch."""
         try:
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
-                f.flush()
+            with open(self.log_file, 'ab', buffering=LOG_WRITE_BUFFER_BYTES) as f:
+                while self.running or not self._log_queue.empty():
+                    try:
+                        log_entry = self._log_queue.get(timeout=0.25)
+                    except queue.Empty:
+                        continue
+                    f.write(_log_line(log_entry))
+                    if self._log_queue.empty():
+                        f.flush()
         except Exception as e:
             print(f"Logging error: {e}")
     
     def read_loop(self):
-        """Read input data from HID device."""
+        """Read input data from HID device.
+
+        Each pass drains every report already queued by the OS: all of them go to DSU (so its
+        button latch sees quick taps) and the log; without those, only the newest is parsed. The GUI is never called from here: it polls the latest
+        current_state on its own timer (see state_dirty), so input rate and redraw rate are independent.
+        """
         last_data = None
+        parsed = None
+        last_error_print = 0.0
+        # Parser for the current report length: _parse_usb_report once reports are full length
+        parse = self.parse_input
+        report_len = None
+        self._read_thread = threading.current_thread()
+        raise_current_thread_priority(READ_THREAD_RT_PRIORITY, 'SCHED_FIFO')
         
         while self.running:
             try:
-                data = self.hid_device.read(64)
-                if data:
-                    self._log_latency()
-                    data_list = list(data)
+                # Block in hidapi until a report arrives (or the timeout, so self.running is rechecked)
+                data = self.hid_device.read(64, HID_READ_TIMEOUT_MS)
+                # DSU (button latch) and the log want every report; the GUI only ever shows the newest
+                every_report = self.log_file or (self.dsu_server and self.dsu_server.running)
+                while data and self.running:
+                    now = time.perf_counter()  # one clock read per report, shared by latency and log gates
+                    self._log_latency(now)
+                    next_data = self.hid_device.read(64)  # non-blocking: next queued report, or empty
+                    if next_data and not every_report:
+                        # GUI only: a newer report is already queued, so don't parse this one
+                        data = next_data
+                        continue
+                    data_list = data  # hidapi returns a fresh list per read; no need to copy it
                     
-                    # Process all data for logging (even if unchanged)
-                    parsed = self.parse_input(data_list)
-                    if parsed:
-                        self.current_state = parsed
-                        
-                        # Update DSU server if running - pass raw bytes for on-demand parsing
-                        if self.dsu_server and self.dsu_server.running:
-                            try:
-                                # Store raw bytes for on-demand parsing (reduces latency)
-                                raw_state = {'raw_bytes': data_list, 'parsed': parsed}
-                                self.dsu_server.update(
-                                    raw_state,
-                                    pad_id=getattr(self, 'dsu_pad_id', 0),
-                                    connection_type=getattr(self, 'dsu_connection_type', 0x01),
-                                )
-                            except Exception as e:
-                                # Silently ignore DSU errors (client may not be connected)
-                                pass
-                        
-                        # Log sample if logging enabled (every second, regardless of changes)
-                        if self.log_file:
-                            self.log_sample(data_list, parsed)
-                        
-                        # Only update display if data changed
-                        if data_list != last_data:
-                            if self.use_gui and self.gui_window:
-                                # Update GUI
-                                self.gui_window.update_state(parsed)
-                        
-                        last_data = data_list
+                    # Duplicate reports are not re-parsed; current_state and DSU already reflect them
+                    if data_list != last_data:
+                        if len(data_list) != report_len:
+                            report_len = len(data_list)
+                            parse = self._parse_usb_report if report_len >= USB_FULL_REPORT_LEN else self.parse_input
+                        parsed = parse(data_list)
+                        if parsed:
+                            self.current_state = parsed
+                            self.state_dirty = True
+                            
+                            # Update DSU server if running (parsed already carries the raw report under 'raw')
+                            if self.dsu_server and self.dsu_server.running:
+                                try:
+                                    self.dsu_server.update(
+                                        parsed,
+                                        pad_id=getattr(self, 'dsu_pad_id', 0),
+                                        connection_type=getattr(self, 'dsu_connection_type', 0x01),
+                                    )
+                                except Exception as e:
+                                    # Silently ignore DSU errors (client may not be connected)
+                                    pass
+                            
+                            last_data = data_list
+                    
+                    # Log sample if logging enabled (every second, regardless of changes)
+                    if parsed and self.log_file:
+                        self.log_sample(data_list, parsed, now)
+                    
+                    data = next_data
             except Exception as e:
                 if 'timeout' not in str(e).lower():
-                    if not self.use_gui:
+                    # A failing device errors on every pass; don't flood the terminal at read rate
+                    now = time.monotonic()
+                    if not self.use_gui and now - last_error_print >= READ_ERROR_PRINT_INTERVAL_SEC:
+                        last_error_print = now
                         print(f"\nRead error: {e}")
-            
-            # Yield to OS without hitting timer interrupt floor (time.sleep(0) on some systems)
-            # HID is non-blocking, so we can poll aggressively
-            time.sleep(0)  # Yield to OS scheduler
+                # A failing read returns at once instead of waiting in hidapi: back off for the read
+                # timeout so an unplugged device can't spin this (real-time priority) thread on a core
+                time.sleep(HID_READ_TIMEOUT_MS / 1000)
 
     def send_rumble(self, large_motor: int, small_motor: int):
         """Send rumble to controller. GC has single motor; any non-zero = on."""
         state = (large_motor > 0 or small_motor > 0)
-        if not self.usb_device or not self.out_endpoint:
+        if not self.usb_device or self._out_ep is None:
             return
         cmd = build_rumble_cmd_usb(state)
         try:
@@ -595,7 +718,7 @@ class NSODriver:
                 usb.util.claim_interface(self.usb_device, INTERFACE_NUM)
             except usb.core.USBError:
                 pass
-            self.usb_device.write(self.out_endpoint, cmd, 1000)
+            self._out_ep.write(cmd, 1000)
         except Exception:
             pass
         finally:
@@ -700,7 +823,12 @@ class NSODriver:
         if self.dsu_server and self._dsu_owned:
             self.dsu_server.stop()
         
-        if self.hid_device:
+        # Let read_loop return from hidapi first: closing the device under an in-progress read is
+        # a use-after-free in hidapi (so it is left open if the thread is somehow still reading)
+        read_thread = self._read_thread
+        if read_thread is not None and read_thread is not threading.current_thread():
+            read_thread.join(READ_THREAD_JOIN_TIMEOUT_SEC)
+        if self.hid_device and not (read_thread and read_thread.is_alive()):
             self.hid_device.close()
         if self.usb_device:
             try:
@@ -729,8 +857,6 @@ class NSOWirelessDriver(NSODriver):
         self._discover_lock = threading.Lock()
         self._discover_samples = []  # list of (phase, data_list); max 300
         self._discover_phase = None
-        self._log_queue = queue.Queue()
-        self._log_worker_started = False
         self._init_latency_monitor()  # uses base class implementation
 
     def _try_set_ble_connection_interval_linux(self):
@@ -785,12 +911,13 @@ class NSOWirelessDriver(NSODriver):
             main_y = main_y_raw - center
             c_x = c_x_raw - center
             c_y = c_y_raw - center
-            sticks = {
-                'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y,
-                'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
-                'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
-                'raw_bytes': {'main': data[4:8], 'c': data[8:12]},
-            }
+            sticks = {'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y}
+            if self._stick_debug or not self.calibrated:  # debug fields; *_raw also feed BLE calibration
+                sticks.update({
+                    'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
+                    'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
+                    'raw_bytes': {'main': data[4:8], 'c': data[8:12]},
+                })
             trigger_l = 255 if buttons.get('L') else 0
             trigger_r = 255 if buttons.get('Z') else 0
             return {'buttons': buttons, 'trigger_l': trigger_l, 'trigger_r': trigger_r, 'sticks': sticks, 'raw': data}
@@ -809,22 +936,23 @@ class NSOWirelessDriver(NSODriver):
                 'L': (b5 & 0x40) != 0, 'ZL': (b5 & 0x80) != 0,
                 'Home': (b4 & 0x10) != 0, 'Capture': (b4 & 0x20) != 0,
             }
-            main_x_raw, main_y_raw = self._stick_12bit_from_bytes(data[3], data[4], data[5])
-            c_x_raw, c_y_raw = self._stick_12bit_from_bytes(data[6], data[7], data[8])
-            if self.calibration['calibrated']:
-                main_x = main_x_raw - self.calibration['main_x_center']
-                main_y = main_y_raw - self.calibration['main_y_center']
-                c_x = c_x_raw - self.calibration['c_x_center']
-                c_y = c_y_raw - self.calibration['c_y_center']
-            else:
-                main_x, main_y = main_x_raw - 2048, main_y_raw - 2048
-                c_x, c_y = c_x_raw - 2048, c_y_raw - 2048
-            sticks = {
-                'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y,
-                'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
-                'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
-                'raw_bytes': {'main': [data[3], data[4], data[5]], 'c': [data[6], data[7], data[8]]},
-            }
+            # 12-bit nibble-packed sticks, decoded inline (bytes 4 and 7 carry a nibble of both axes)
+            s4, s7 = data[4], data[7]
+            main_x_raw, main_y_raw = data[3] | ((s4 & 0x0F) << 8), (s4 >> 4) | (data[5] << 4)
+            c_x_raw, c_y_raw = data[6] | ((s7 & 0x0F) << 8), (s7 >> 4) | (data[8] << 4)
+            # Subtract stick centers (2048 = middle of 12-bit range until calibrated)
+            main_cx, main_cy, c_cx, c_cy = self.stick_centers
+            main_x = main_x_raw - main_cx
+            main_y = main_y_raw - main_cy
+            c_x = c_x_raw - c_cx
+            c_y = c_y_raw - c_cy
+            sticks = {'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y}
+            if self._stick_debug or not self.calibrated:  # debug fields; *_raw also feed BLE calibration
+                sticks.update({
+                    'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
+                    'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
+                    'raw_bytes': {'main': [data[3], data[4], data[5]], 'c': [data[6], data[7], data[8]]},
+                })
             trigger_l = 255 if buttons.get('ZL') else 0
             trigger_r = 255 if buttons.get('Z') else 0
             return {'buttons': buttons, 'trigger_l': trigger_l, 'trigger_r': trigger_r, 'sticks': sticks, 'raw': data}
@@ -842,22 +970,22 @@ class NSOWirelessDriver(NSODriver):
             'L': (b5 & 0x40) != 0, 'ZL': (b5 & 0x80) != 0,
             'Home': (b4 & 0x10) != 0, 'Capture': (b4 & 0x20) != 0,
         }
-        main_x_raw, main_y_raw = self._stick_12bit_from_bytes(data[6 + o], data[7 + o], data[8 + o])
-        c_x_raw, c_y_raw = self._stick_12bit_from_bytes(data[9 + o], data[10 + o], data[11 + o])
-        if self.calibration['calibrated']:
-            main_x = main_x_raw - self.calibration['main_x_center']
-            main_y = main_y_raw - self.calibration['main_y_center']
-            c_x = c_x_raw - self.calibration['c_x_center']
-            c_y = c_y_raw - self.calibration['c_y_center']
-        else:
-            main_x, main_y = main_x_raw - 2048, main_y_raw - 2048
-            c_x, c_y = c_x_raw - 2048, c_y_raw - 2048
-        sticks = {
-            'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y,
-            'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
-            'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
-            'raw_bytes': {'main': [data[6 + o], data[7 + o], data[8 + o]], 'c': [data[9 + o], data[10 + o], data[11 + o]]},
-        }
+        s7, s10 = data[7 + o], data[10 + o]
+        main_x_raw, main_y_raw = data[6 + o] | ((s7 & 0x0F) << 8), (s7 >> 4) | (data[8 + o] << 4)
+        c_x_raw, c_y_raw = data[9 + o] | ((s10 & 0x0F) << 8), (s10 >> 4) | (data[11 + o] << 4)
+        # Subtract stick centers (2048 = middle of 12-bit range until calibrated)
+        main_cx, main_cy, c_cx, c_cy = self.stick_centers
+        main_x = main_x_raw - main_cx
+        main_y = main_y_raw - main_cy
+        c_x = c_x_raw - c_cx
+        c_y = c_y_raw - c_cy
+        sticks = {'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y}
+        if self._stick_debug or not self.calibrated:  # debug fields; *_raw also feed BLE calibration
+            sticks.update({
+                'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
+                'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
+                'raw_bytes': {'main': [data[6 + o], data[7 + o], data[8 + o]], 'c': [data[9 + o], data[10 + o], data[11 + o]]},
+            })
         trigger_l = 255 if buttons.get('ZL') else 0
         trigger_r = 255 if buttons.get('Z') else 0
         return {'buttons': buttons, 'trigger_l': trigger_l, 'trigger_r': trigger_r, 'sticks': sticks, 'raw': data}
@@ -908,22 +1036,19 @@ class NSOWirelessDriver(NSODriver):
             'Dpad_Right': (b5 & 0x04) != 0, 'Dpad_Left': (b5 & 0x08) != 0,
             'L': (b5 & 0x40) != 0, 'ZL': (b5 & 0x80) != 0,
         }
-        if self.calibration['calibrated']:
-            main_x = lx_raw - self.calibration['main_x_center']
-            main_y = ly_raw - self.calibration['main_y_center']
-            c_x = rx_raw - self.calibration['c_x_center']
-            c_y = ry_raw - self.calibration['c_y_center']
-        else:
-            main_x = lx_raw - 2048
-            main_y = ly_raw - 2048
-            c_x = rx_raw - 2048
-            c_y = ry_raw - 2048
-        sticks = {
-            'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y,
-            'main_x_raw': lx_raw, 'main_y_raw': ly_raw, 'c_x_raw': rx_raw, 'c_y_raw': ry_raw,
-            'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
-            'raw_bytes': stick_bytes,
-        }
+        # Subtract stick centers (2048 = middle of 12-bit range until calibrated)
+        main_cx, main_cy, c_cx, c_cy = self.stick_centers
+        main_x = lx_raw - main_cx
+        main_y = ly_raw - main_cy
+        c_x = rx_raw - c_cx
+        c_y = ry_raw - c_cy
+        sticks = {'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y}
+        if self._stick_debug or not self.calibrated:  # debug fields; *_raw also feed BLE calibration
+            sticks.update({
+                'main_x_raw': lx_raw, 'main_y_raw': ly_raw, 'c_x_raw': rx_raw, 'c_y_raw': ry_raw,
+                'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
+                'raw_bytes': stick_bytes,
+            })
         if trigger_l == 0 and trigger_r == 0:
             trigger_l = 255 if buttons.get('ZL') else 0
             trigger_r = 255 if buttons.get('Z') else 0
@@ -948,22 +1073,19 @@ class NSOWirelessDriver(NSODriver):
         main_y_raw = (data[6] >> 4) | (data[7] << 4)
         c_x_raw = data[8] | ((data[9] & 0x0F) << 8)
         c_y_raw = (data[9] >> 4) | (data[10] << 4)
-        if self.calibration['calibrated']:
-            main_x = main_x_raw - self.calibration['main_x_center']
-            main_y = main_y_raw - self.calibration['main_y_center']
-            c_x = c_x_raw - self.calibration['c_x_center']
-            c_y = c_y_raw - self.calibration['c_y_center']
-        else:
-            main_x = main_x_raw - 2048
-            main_y = main_y_raw - 2048
-            c_x = c_x_raw - 2048
-            c_y = c_y_raw - 2048
-        sticks = {
-            'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y,
-            'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
-            'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
-            'raw_bytes': {'main': [data[5], data[6], data[7]], 'c': [data[8], data[9], data[10]]},
-        }
+        # Subtract stick centers (2048 = middle of 12-bit range until calibrated)
+        main_cx, main_cy, c_cx, c_cy = self.stick_centers
+        main_x = main_x_raw - main_cx
+        main_y = main_y_raw - main_cy
+        c_x = c_x_raw - c_cx
+        c_y = c_y_raw - c_cy
+        sticks = {'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y}
+        if self._stick_debug or not self.calibrated:  # debug fields; *_raw also feed BLE calibration
+            sticks.update({
+                'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
+                'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
+                'raw_bytes': {'main': [data[5], data[6], data[7]], 'c': [data[8], data[9], data[10]]},
+            })
         trigger_l = data[12] if len(data) > 12 else 0
         trigger_r = data[13] if len(data) > 13 else 0
         if trigger_l == 0 and trigger_r == 0:
@@ -992,29 +1114,27 @@ class NSOWirelessDriver(NSODriver):
         main_y_raw = (data[11] >> 4) | (data[12] << 4)
         c_x_raw = data[13] | ((data[14] & 0x0F) << 8)
         c_y_raw = (data[14] >> 4) | (data[15] << 4)
-        if self.calibration['calibrated']:
-            main_x = main_x_raw - self.calibration['main_x_center']
-            main_y = main_y_raw - self.calibration['main_y_center']
-            c_x = c_x_raw - self.calibration['c_x_center']
-            c_y = c_y_raw - self.calibration['c_y_center']
-        else:
-            main_x = main_x_raw - 2048
-            main_y = main_y_raw - 2048
-            c_x = c_x_raw - 2048
-            c_y = c_y_raw - 2048
-        sticks = {
-            'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y,
-            'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
-            'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
-            'raw_bytes': {'main': [data[10], data[11], data[12]], 'c': [data[13], data[14], data[15]]},
-        }
+        # Subtract stick centers (2048 = middle of 12-bit range until calibrated)
+        main_cx, main_cy, c_cx, c_cy = self.stick_centers
+        main_x = main_x_raw - main_cx
+        main_y = main_y_raw - main_cy
+        c_x = c_x_raw - c_cx
+        c_y = c_y_raw - c_cy
+        sticks = {'main_x': main_x, 'main_y': main_y, 'c_x': c_x, 'c_y': c_y}
+        if self._stick_debug or not self.calibrated:  # debug fields; *_raw also feed BLE calibration
+            sticks.update({
+                'main_x_raw': main_x_raw, 'main_y_raw': main_y_raw, 'c_x_raw': c_x_raw, 'c_y_raw': c_y_raw,
+                'main_x_offset': main_x, 'main_y_offset': main_y, 'c_x_offset': c_x, 'c_y_offset': c_y,
+                'raw_bytes': {'main': [data[10], data[11], data[12]], 'c': [data[13], data[14], data[15]]},
+            })
         trigger_l = data[60] if len(data) > 60 else 0
         trigger_r = data[61] if len(data) > 61 else 0
         return {'buttons': buttons, 'trigger_l': trigger_l, 'trigger_r': trigger_r, 'sticks': sticks, 'raw': data}
 
     def _notification_handler(self, sender, data):
         """Handle BLE input report notifications. Native NSO (sliding-window) first; 63-byte = BlueRetro layout."""
-        self._log_latency()
+        now = time.perf_counter()
+        self._log_latency(now)
         data_list = list(data)
         if getattr(self, 'ble_discover', False) and getattr(self, '_discover_phase', None):
             with self._discover_lock:
@@ -1044,7 +1164,7 @@ class NSOWirelessDriver(NSODriver):
 
         # Deferred calibration from parsed stick raw values (median over 50 samples, skip first few reports).
         # Run median computation in a background thread so the notification callback returns immediately.
-        if not self.calibration['calibrated'] and 'sticks' in parsed and 'main_x_raw' in parsed['sticks']:
+        if not self.calibrated and 'sticks' in parsed and 'main_x_raw' in parsed['sticks']:
             if getattr(self, '_ble_calibration_skip', 0) > 0:
                 self._ble_calibration_skip -= 1
             else:
@@ -1058,25 +1178,23 @@ class NSOWirelessDriver(NSODriver):
                     self._ble_calibration_samples.clear()
 
                     def _apply_calibration():
-                        def median(vals):
-                            srt = sorted(vals)
-                            return srt[len(srt) // 2]
-                        self.calibration['main_x_center'] = median(s['main_x'] for s in samples)
-                        self.calibration['main_y_center'] = median(s['main_y'] for s in samples)
-                        self.calibration['c_x_center'] = median(s['c_x'] for s in samples)
-                        self.calibration['c_y_center'] = median(s['c_y'] for s in samples)
-                        self.calibration['calibrated'] = True
+                        self.set_stick_centers(
+                            _median(s['main_x'] for s in samples),
+                            _median(s['main_y'] for s in samples),
+                            _median(s['c_x'] for s in samples),
+                            _median(s['c_y'] for s in samples),
+                        )
                         print("  ✓ BLE stick calibration complete (median of 50 samples)")
 
                     threading.Thread(target=_apply_calibration, daemon=True).start()
 
         self.current_state = parsed
+        self.state_dirty = True
 
         if self.dsu_server and self.dsu_server.running:
             try:
-                raw_state = {'raw_bytes': data_list, 'parsed': parsed}
                 self.dsu_server.update(
-                    raw_state,
+                    parsed,
                     pad_id=getattr(self, 'dsu_pad_id', 0),
                     connection_type=getattr(self, 'dsu_connection_type', 0x02),
                 )
@@ -1084,15 +1202,8 @@ class NSOWirelessDriver(NSODriver):
                 pass
 
         if self.log_file:
-            try:
-                self._log_queue.put_nowait((list(data_list), parsed))
-            except queue.Full:
-                pass
-
-        if self.use_gui and self.gui_window:
-            if hasattr(self.gui_window, 'root'):
-                self.gui_window.root.after(0, lambda p=parsed: self.gui_window.update_state(p))
-            # PyQt5 uses a timer that reads current_state in update_display(); no call needed
+            self.log_sample(data_list, parsed, now)
+        # GUI: both GUIs poll current_state/state_dirty on their own timer; nothing to push from here
 
     def _discover_collect(self, phase, duration_sec=2.5):
         """Set discover phase, wait for samples, return list of raw data lists (and clear buffer)."""
@@ -1134,7 +1245,6 @@ class NSOWirelessDriver(NSODriver):
             if not vals:
                 baseline.append(0)
                 continue
-            from collections import Counter
             baseline.append(Counter(vals).most_common(1)[0][0])
         print(f"   Baseline captured ({len(samples)} samples, report length {length} bytes).")
         print(f"   First 16 bytes (baseline): {list(baseline[:16])}\n")
@@ -1395,7 +1505,7 @@ class NSOWirelessDriver(NSODriver):
                             self._ble_client = client
                             self._ble_cmd_char = cmd_char
                             if init_char:
-                                for data in (bytearray(DEFAULT_REPORT_DATA), build_led_cmd_ble(self.dsu_pad_id)):
+                                for data in (DEFAULT_REPORT_DATA, build_led_cmd_ble(self.dsu_pad_id)):
                                     try:
                                         await client.write_gatt_char(init_char.uuid, data)
                                     except Exception:
@@ -1467,7 +1577,7 @@ class NSOWirelessDriver(NSODriver):
                             self._ble_client = client
                             self._ble_cmd_char = cmd_char
                             if init_char:
-                                for data in (bytearray(DEFAULT_REPORT_DATA), build_led_cmd_ble(self.dsu_pad_id)):
+                                for data in (DEFAULT_REPORT_DATA, build_led_cmd_ble(self.dsu_pad_id)):
                                     try:
                                         await client.write_gatt_char(init_char.uuid, data)
                                     except Exception:
@@ -1531,21 +1641,6 @@ class NSOWirelessDriver(NSODriver):
 
         self.running = True
 
-        def _log_worker():
-            while self.running:
-                try:
-                    data_list, parsed = self._log_queue.get(timeout=0.25)
-                    if self.log_file:
-                        self.log_sample(data_list, parsed)
-                except queue.Empty:
-                    continue
-                except Exception:
-                    pass
-
-        if not self._log_worker_started:
-            self._log_worker_started = True
-            threading.Thread(target=_log_worker, daemon=True).start()
-
         def run_ble():
             asyncio.run(self._run_wireless_async())
 
@@ -1734,7 +1829,8 @@ class StickWidget:
     
     def __init__(self, width, height):
         from PyQt5.QtWidgets import QWidget
-        from PyQt5.QtGui import QPainter, QColor, QPen
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap
         
         # Create a custom QWidget
         class _StickWidget(QWidget):
@@ -1745,21 +1841,26 @@ class StickWidget:
                 self.stick_x = 0
                 self.stick_y = 0
                 self.max_range = 128
+                # Fixed size, so the stick -> pixel scale is constant (same radius as paintEvent)
+                self.scale = (min(w, h) // 2 - 10) / self.max_range
+                self._background = None  # QPixmap of the static ring/crosshair, rendered on first paint
                 
             def set_stick_position(self, x, y):
                 self.stick_x = max(-self.max_range, min(self.max_range, x))
                 self.stick_y = max(-self.max_range, min(self.max_range, y))
                 self.update()
                 
-            def paintEvent(self, event):
-                painter = QPainter(self)
-                painter.setRenderHint(QPainter.Antialiasing)
-                
-                w = self.width()
-                h = self.height()
+            def _render_background(self, w, h, dpr):
+                """Draw the static ring, crosshair and center dot once into a pixmap.
+                Rendered at the screen's device pixel ratio so it stays sharp on HiDPI displays."""
                 center_x = w // 2
                 center_y = h // 2
                 radius = min(w, h) // 2 - 10
+                pixmap = QPixmap(int(w * dpr), int(h * dpr))
+                pixmap.setDevicePixelRatio(dpr)  # Painter below still works in widget (logical) coordinates
+                pixmap.fill(Qt.transparent)
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.Antialiasing)
                 
                 # Draw background circle (ring)
                 painter.setPen(QPen(QColor("gray"), 2))
@@ -1773,10 +1874,27 @@ class StickWidget:
                 # Draw center dot
                 painter.setBrush(QColor("lightgray"))
                 painter.drawEllipse(center_x - 2, center_y - 2, 4, 4)
+                painter.end()
+                return pixmap
+                
+            def paintEvent(self, event):
+                w = self.width()
+                h = self.height()
+                center_x = w // 2
+                center_y = h // 2
+                
+                # Static background: one pixmap blit instead of re-stroking the ring and crosshair.
+                # Re-rendered if the ratio changes (window moved to a screen with a different scale)
+                dpr = self.devicePixelRatioF()
+                if self._background is None or self._background.devicePixelRatioF() != dpr:
+                    self._background = self._render_background(w, h, dpr)
+                painter = QPainter(self)
+                painter.drawPixmap(0, 0, self._background)
+                painter.setRenderHint(QPainter.Antialiasing)
                 
                 # Draw stick position dot
-                stick_x = center_x + int((self.stick_x / self.max_range) * radius)
-                stick_y = center_y - int((self.stick_y / self.max_range) * radius)  # Invert Y
+                stick_x = center_x + int(self.stick_x * self.scale)
+                stick_y = center_y - int(self.stick_y * self.scale)  # Invert Y
                 
                 painter.setBrush(QColor("blue"))
                 painter.setPen(QPen(QColor("darkblue"), 2))
@@ -1796,6 +1914,13 @@ class StickWidget:
 class ControllerGUIPyQt5:
     """PyQt5 GUI for visualizing controller input."""
     
+    # Button look, set once on the window. Pressing toggles the dynamic "pressed" property and
+    # repolishes just that label, instead of re-parsing a per-widget stylesheet.
+    BUTTON_STYLESHEET = (
+        'QLabel[controllerButton="true"] { border: 2px solid gray; padding: 5px; min-width: 60px; }'
+        ' QLabel[controllerButton="true"][pressed="true"] { background-color: yellow; }'
+    )
+    
     def __init__(self, driver):
         from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QVBoxLayout, 
                                      QHBoxLayout, QFrame, QGridLayout)
@@ -1810,6 +1935,15 @@ class ControllerGUIPyQt5:
         self.window = QWidget()
         self.window.setWindowTitle("NSO GameCube Controller")
         self.window.setGeometry(100, 100, 800, 600)
+        self.window.setStyleSheet(self.BUTTON_STYLESHEET)
+        
+        # Last rendered values: widgets are only restyled/resized when these change
+        self._last_pressed = []  # per button_labels entry
+        self._last_buttons = None  # buttons dict last rendered
+        self._last_trigger_l = None
+        self._last_trigger_r = None
+        self._last_main = None
+        self._last_c = None
         
         # Start read loop in background thread
         read_thread = threading.Thread(target=driver.read_loop, daemon=True)
@@ -1849,7 +1983,7 @@ class ControllerGUIPyQt5:
         left_layout.addWidget(btn_label)
         
         button_grid = QGridLayout()
-        self.button_labels = {}
+        self.button_labels = []  # (button name, QLabel), flat list in button_config order
         button_config = [
             ('A', 0, 0), ('B', 0, 1), ('X', 0, 2), ('Y', 0, 3),
             ('Start', 1, 0), ('Z', 1, 1), ('R', 1, 2), ('L', 1, 3),
@@ -1861,9 +1995,11 @@ class ControllerGUIPyQt5:
         for btn_name, row, col in button_config:
             btn = QLabel(btn_name)
             btn.setAlignment(Qt.AlignCenter)
-            btn.setStyleSheet("border: 2px solid gray; padding: 5px; min-width: 60px;")
+            btn.setProperty("controllerButton", True)
+            btn.setProperty("pressed", False)
             button_grid.addWidget(btn, row, col)
-            self.button_labels[btn_name] = btn
+            self.button_labels.append((btn_name, btn))
+            self._last_pressed.append(None)
         
         left_layout.addLayout(button_grid)
         
@@ -1872,18 +2008,15 @@ class ControllerGUIPyQt5:
         trigger_label.setFont(QFont("Arial", 12, QFont.Bold))
         left_layout.addWidget(trigger_label)
         
+        # Trigger bars: fixed-size progress bars, so a new value only repaints (no relayout)
         self.trigger_l_label = QLabel("L: 0")
         left_layout.addWidget(self.trigger_l_label)
-        self.trigger_l_bar = QFrame()
-        self.trigger_l_bar.setStyleSheet("background-color: blue; max-height: 20px;")
-        self.trigger_l_bar.setFixedHeight(20)
+        self.trigger_l_bar = self._make_trigger_bar("blue")
         left_layout.addWidget(self.trigger_l_bar)
         
         self.trigger_r_label = QLabel("R: 0")
         left_layout.addWidget(self.trigger_r_label)
-        self.trigger_r_bar = QFrame()
-        self.trigger_r_bar.setStyleSheet("background-color: red; max-height: 20px;")
-        self.trigger_r_bar.setFixedHeight(20)
+        self.trigger_r_bar = self._make_trigger_bar("red")
         left_layout.addWidget(self.trigger_r_bar)
         
         left_frame.setLayout(left_layout)
@@ -1921,46 +2054,79 @@ class ControllerGUIPyQt5:
         main_layout.addLayout(content_layout)
         self.window.setLayout(main_layout)
         
+    def _make_trigger_bar(self, color):
+        """200x20 bar for an analog trigger value (0-255)."""
+        from PyQt5.QtWidgets import QProgressBar
+        
+        bar = QProgressBar()
+        bar.setRange(0, 255)
+        bar.setValue(0)
+        bar.setTextVisible(False)
+        bar.setFixedSize(200, 20)
+        bar.setStyleSheet(f"QProgressBar {{ border: none; background: transparent; }} "
+                          f"QProgressBar::chunk {{ background-color: {color}; }}")
+        return bar
+        
     def update_display(self):
         """Update the display with current controller state."""
         if not self.driver.running:
             self.window.close()
             return
             
-        if self.driver.current_state:
-            state = self.driver.current_state
-            
-            # Update buttons
-            for btn_name, btn_widget in self.button_labels.items():
-                pressed = state['buttons'].get(btn_name, False)
-                if pressed:
-                    btn_widget.setStyleSheet("border: 2px solid gray; padding: 5px; min-width: 60px; background-color: yellow;")
-                else:
-                    btn_widget.setStyleSheet("border: 2px solid gray; padding: 5px; min-width: 60px;")
+        # Nothing new since the last redraw: skip (the timer fires at 60 Hz regardless of input)
+        if not self.driver.state_dirty:
+            return
+        self.driver.state_dirty = False  # clear before reading, so a report landing now re-marks it
+        state = self.driver.current_state  # read the slot once; a later report replaces it, never mutates it
+        if state:
             
-            # Update triggers
-            trigger_l = state.get('trigger_l', 0)
-            trigger_r = state.get('trigger_r', 0)
+            # Update buttons (a repolish per change, so only on change). One C-level dict compare
+            # skips the per-button pass when no button changed (e.g. only a stick moved).
+            buttons = state['buttons']
+            if buttons != self._last_buttons:
+                self._last_buttons = buttons
+                # Loop-invariant lookups bound to locals once
+                last_pressed = self._last_pressed
+                is_pressed = buttons.get
+                for i, (btn_name, btn_widget) in enumerate(self.button_labels):
+                    pressed = is_pressed(btn_name, False)
+                    if pressed != last_pressed[i]:
+                        last_pressed[i] = pressed
+                        btn_widget.setProperty("pressed", pressed)
+                        style = btn_widget.style()  # re-evaluate the [pressed] selector for this label only
+                        style.unpolish(btn_widget)
+                        style.polish(btn_widget)
             
-            self.trigger_l_label.setText(f"L: {trigger_l}")
-            self.trigger_l_bar.setFixedWidth(int((trigger_l / 255) * 200))
+            # Update triggers (bar and readout only when the value changed; setText repaints even if equal)
+            trigger_l = state['trigger_l']
+            trigger_r = state['trigger_r']
             
-            self.trigger_r_label.setText(f"R: {trigger_r}")
-            self.trigger_r_bar.setFixedWidth(int((trigger_r / 255) * 200))
+            if trigger_l != self._last_trigger_l:
+                self._last_trigger_l = trigger_l
+                self.trigger_l_label.setText(f"L: {trigger_l}")
+                self.trigger_l_bar.setValue(trigger_l)
             
-            # Update sticks
-            sticks = state.get('sticks', {})
-            main_x = sticks.get('main_x', 0)
-            main_y = sticks.get('main_y', 0)
-            c_x = sticks.get('c_x', 0)
-            c_y = sticks.get('c_y', 0)
+            if trigger_r != self._last_trigger_r:
+                self._last_trigger_r = trigger_r
+                self.trigger_r_label.setText(f"R: {trigger_r}")
+                self.trigger_r_bar.setValue(trigger_r)
             
-            self.main_stick_label.setText(f"X: {main_x:+4d}, Y: {main_y:+4d}")
-            self.c_stick_label.setText(f"X: {c_x:+4d}, Y: {c_y:+4d}")
+            # Update sticks: readout and position only when the stick moved
+            # (each set_stick_position schedules a repaint)
+            sticks = state['sticks']
+            main_x = sticks['main_x']
+            main_y = sticks['main_y']
+            c_x = sticks['c_x']
+            c_y = sticks['c_y']
             
-            # Update stick positions
-            self.main_stick_canvas.set_stick_position(main_x, main_y)
-            self.c_stick_canvas.set_stick_position(c_x, c_y)
+            if (main_x, main_y) != self._last_main:
+                self._last_main = (main_x, main_y)
+                self.main_stick_label.setText(f"X: {main_x:+4d}, Y: {main_y:+4d}")
+                self.main_stick_canvas.set_stick_position(main_x, main_y)
+            if (c_x, c_y) != self._last_c:
+                self._last_c = (c_x, c_y)
+                self.c_stick_label.setText(f"X: {c_x:+4d}, Y: {c_y:+4d}")
+                self.c_stick_canvas.set_stick_position(c_x, c_y)
         
     def run(self):
         """Run the GUI main loop."""
@@ -1974,6 +2140,14 @@ class ControllerGUIPyQt5:
 class ControllerGUI:
     """Tkinter GUI for visualizing controller input."""
     
+    STICK_MAX_RANGE = 128  # stick value shown at the ring's edge
+    STICK_RADIUS = 90  # ring radius in pixels (inside a 200x200 white area)
+    STICK_PANEL_HEIGHT = 254  # title + 200 px stick area + readout
+    # Poll period for new controller state. Polling (not a virtual event from the read thread) keeps
+    # the input thread from ever waiting on Tk; idle polls are just a flag check, so poll often
+    # (<= 125 Hz of redraws) to keep the added input-to-display delay under ~8 ms.
+    POLL_MS = 8
+    
     def __init__(self, driver):
         self.driver = driver
         self.root = tk.Tk()
@@ -1981,6 +2155,14 @@ class ControllerGUI:
         self.root.geometry("800x600")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        # Last rendered values: widgets are only reconfigured when these change
+        self._last_pressed = []  # per button_labels entry
+        self._last_buttons = None  # buttons dict last rendered
+        self._last_trigger_l = None
+        self._last_trigger_r = None
+        self._last_main = None
+        self._last_c = None
+        
         # Start read loop in background thread
         read_thread = threading.Thread(target=driver.read_loop, daemon=True)
         read_thread.start()
@@ -2006,7 +2188,7 @@ class ControllerGUI:
         button_frame.pack(pady=10)
         
         # Button labels and states
-        self.button_labels = {}
+        self.button_labels = []  # (button name, frame, label), flat list in button_config order
         button_config = [
             ('A', 0, 0), ('B', 0, 1), ('X', 0, 2), ('Y', 0, 3),
             ('Start', 1, 0), ('Z', 1, 1), ('R', 1, 2), ('L', 1, 3),
@@ -2021,7 +2203,8 @@ class ControllerGUI:
             
             label = tk.Label(frame, text=btn_name, font=("Arial", 9))
             label.pack(fill=tk.BOTH, expand=True)
-            self.button_labels[btn_name] = {'frame': frame, 'label': label}
+            self.button_labels.append((btn_name, frame, label))
+            self._last_pressed.append(None)
         
         # Triggers
         trigger_frame = tk.Frame(left_frame)
@@ -2045,136 +2228,139 @@ class ControllerGUI:
         right_frame = tk.Frame(main_frame)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
         
-        # Main stick
-        main_stick_frame = tk.Frame(right_frame)
-        main_stick_frame.pack(pady=10)
-        
-        tk.Label(main_stick_frame, text="Main Stick", font=("Arial", 12, "bold")).pack()
-        self.main_stick_canvas = tk.Canvas(main_stick_frame, width=200, height=200, bg="white", borderwidth=2, relief=tk.SUNKEN)
-        self.main_stick_canvas.pack()
-        self.main_stick_label = tk.Label(main_stick_frame, text="X: 0, Y: 0")
-        self.main_stick_label.pack()
-        
-        # C-stick
-        c_stick_frame = tk.Frame(right_frame)
-        c_stick_frame.pack(pady=10)
-        
-        tk.Label(c_stick_frame, text="C-Stick", font=("Arial", 12, "bold")).pack()
-        self.c_stick_canvas = tk.Canvas(c_stick_frame, width=200, height=200, bg="white", borderwidth=2, relief=tk.SUNKEN)
-        self.c_stick_canvas.pack()
-        self.c_stick_label = tk.Label(c_stick_frame, text="X: 0, Y: 0")
-        self.c_stick_label.pack()
-        
-        # Draw stick backgrounds
-        self.draw_stick_background(self.main_stick_canvas)
-        self.draw_stick_background(self.c_stick_canvas)
-        
-    def draw_stick_background(self, canvas):
-        """Draw the stick visualization background."""
-        # Store canvas dimensions for later use
-        canvas.update_idletasks()
-        width = canvas.winfo_width() or 200
-        height = canvas.winfo_height() or 200
-        
-    def update_stick(self, canvas, label_widget, x, y, max_range=128):
-        """Update stick visualization - draws background ring and moving dot."""
-        # Clear only the stick dot, keep background
-        canvas.delete("stick")
-        
-        # Get canvas dimensions
-        canvas.update_idletasks()
-        width = canvas.winfo_width() or 200
-        height = canvas.winfo_height() or 200
-        center_x, center_y = width // 2, height // 2
-        radius = min(width, height) // 2 - 10
-        
-        # Draw background circle and crosshair (tagged as background so they persist)
-        if not canvas.find_withtag("background"):
-            # Draw outer circle (ring)
-            canvas.create_oval(center_x - radius, center_y - radius,
-                              center_x + radius, center_y + radius,
-                              outline="gray", width=2, tags="background")
-            
-            # Draw center crosshair
-            canvas.create_line(center_x - radius, center_y, center_x + radius, center_y, 
-                              fill="lightgray", tags="background")
-            canvas.create_line(center_x, center_y - radius, center_x, center_y + radius, 
-                              fill="lightgray", tags="background")
-            
-            # Draw center dot
-            canvas.create_oval(center_x - 2, center_y - 2, center_x + 2, center_y + 2,
-                              fill="lightgray", outline="", tags="background")
+        # Both sticks share one canvas (one widget to lay out and redraw): main stick on top, C-stick
+        # below, each a title, a ring with the moving dot, and an X/Y readout drawn as canvas items
+        self.stick_canvas = tk.Canvas(right_frame, width=200, height=2 * self.STICK_PANEL_HEIGHT,
+                                      highlightthickness=0)
+        self.stick_canvas.pack(pady=10)
+        self.main_stick = self.draw_stick_panel(self.stick_canvas, 0, "Main Stick")
+        self.c_stick = self.draw_stick_panel(self.stick_canvas, self.STICK_PANEL_HEIGHT, "C-Stick")
+        
+    def draw_stick_panel(self, canvas, top, title):
+        """Draw one stick's title, background and readout starting at y=top.
+        Returns (canvas, dot item id, readout item id, center_x, center_y, radius / STICK_MAX_RANGE)."""
+        center_x = 100
+        center_y = top + 30 + self.STICK_RADIUS + 10
+        canvas.create_text(center_x, top + 12, text=title, font=("Arial", 12, "bold"))
+        canvas.create_rectangle(center_x - 100, center_y - 100, center_x + 100, center_y + 100,
+                                fill="white", outline="gray")
+        dot = self.draw_stick_background(canvas, center_x, center_y, self.STICK_RADIUS)
+        readout = canvas.create_text(center_x, center_y + 100 + 12, text="X: 0, Y: 0")
+        return (canvas, dot, readout, center_x, center_y, self.STICK_RADIUS / self.STICK_MAX_RANGE)
+        
+    def draw_stick_background(self, canvas, center_x, center_y, radius):
+        """Draw the stick visualization background and create the stick dot. Returns the dot's item id."""
+        # Draw outer circle (ring)
+        canvas.create_oval(center_x - radius, center_y - radius,
+                          center_x + radius, center_y + radius,
+                          outline="gray", width=2, tags="background")
+        
+        # Draw center crosshair
+        canvas.create_line(center_x - radius, center_y, center_x + radius, center_y, 
+                          fill="lightgray", tags="background")
+        canvas.create_line(center_x, center_y - radius, center_x, center_y + radius, 
+                          fill="lightgray", tags="background")
+        
+        # Draw center dot
+        canvas.create_oval(center_x - 2, center_y - 2, center_x + 2, center_y + 2,
+                          fill="lightgray", outline="", tags="background")
+        
+        # Stick position dot (blue dot that moves): created once, then only moved with coords()
+        return canvas.create_oval(center_x - 8, center_y - 8, center_x + 8, center_y + 8,
+                                  fill="blue", outline="darkblue", width=2, tags="stick")
+        
+    def update_stick(self, stick, x, y):
+        """Update stick visualization - moves the dot and updates the readout (stick from draw_stick_panel)."""
+        canvas, dot, readout, center_x, center_y, scale = stick
         
         # Clamp values to range
+        max_range = self.STICK_MAX_RANGE
         x = max(-max_range, min(max_range, x))
         y = max(-max_range, min(max_range, y))
         
-        # Scale to canvas coordinates (normalize to radius)
-        stick_x = center_x + int((x / max_range) * radius)
-        stick_y = center_y - int((y / max_range) * radius)  # Invert Y for screen coordinates
+        # Scale to canvas coordinates (normalize to radius; scale precomputed)
+        stick_x = center_x + int(x * scale)
+        stick_y = center_y - int(y * scale)  # Invert Y for screen coordinates
         
-        # Draw stick position dot (blue dot that moves)
-        canvas.create_oval(stick_x - 8, stick_y - 8, stick_x + 8, stick_y + 8,
-                          fill="blue", outline="darkblue", width=2, tags="stick")
+        # Move the stick position dot (no item delete/create, so no display list rebuild)
+        canvas.coords(dot, stick_x - 8, stick_y - 8, stick_x + 8, stick_y + 8)
         
-        # Update label
-        label_widget.config(text=f"X: {x:+4d}, Y: {y:+4d}")
+        # Update readout
+        canvas.itemconfigure(readout, text=f"X: {x:+4d}, Y: {y:+4d}")
         
     def update_state(self, state):
-        """Update GUI with new controller state."""
-        # Update buttons
-        for btn_name, btn_data in self.button_labels.items():
-            pressed = state['buttons'].get(btn_name, False)
-            if pressed:
-                btn_data['frame'].config(bg="yellow")
-                btn_data['label'].config(bg="yellow", fg="black")
-            else:
-                btn_data['frame'].config(bg="SystemButtonFace")
-                btn_data['label'].config(bg="SystemButtonFace", fg="black")
+        """Update GUI with new controller state (a parse_input()-shaped dict; all keys always present)."""
+        # Update buttons (each config() redraws the widget, so only on change). One C-level dict
+        # compare skips the per-button pass when no button changed (e.g. only a stick moved).
+        buttons = state['buttons']
+        if buttons != self._last_buttons:
+            self._last_buttons = buttons
+            # Loop-invariant lookups bound to locals once
+            last_pressed = self._last_pressed
+            is_pressed = buttons.get
+            for i, (btn_name, frame, label) in enumerate(self.button_labels):
+                pressed = is_pressed(btn_name, False)
+                if pressed == last_pressed[i]:
+                    continue
+                last_pressed[i] = pressed
+                if pressed:
+                    frame.config(bg="yellow")
+                    label.config(bg="yellow", fg="black")
+                else:
+                    frame.config(bg="SystemButtonFace")
+                    label.config(bg="SystemButtonFace", fg="black")
         
         # Update triggers
-        trigger_l = state.get('trigger_l', 0)
-        trigger_r = state.get('trigger_r', 0)
+        trigger_l = state['trigger_l']
+        trigger_r = state['trigger_r']
         
         # Update L trigger bar
-        l_width = int((trigger_l / 255) * 200)
-        self.trigger_l_bar.place(x=0, y=0, width=l_width)
-        self.trigger_l_label.config(text=f"L: {trigger_l}")
+        if trigger_l != self._last_trigger_l:
+            self._last_trigger_l = trigger_l
+            l_width = trigger_l * 200 // 255  # integer scale to the 200 px bar
+            self.trigger_l_bar.place(x=0, y=0, width=l_width)
+            self.trigger_l_label.config(text=f"L: {trigger_l}")
         
         # Update R trigger bar
-        r_width = int((trigger_r / 255) * 200)
-        self.trigger_r_bar.place(x=0, y=0, width=r_width)
-        self.trigger_r_label.config(text=f"R: {trigger_r}")
-        
-        # Update sticks
-        sticks = state.get('sticks', {})
-        self.update_stick(self.main_stick_canvas, self.main_stick_label,
-                         sticks.get('main_x', 0), sticks.get('main_y', 0))
-        self.update_stick(self.c_stick_canvas, self.c_stick_label,
-                         sticks.get('c_x', 0), sticks.get('c_y', 0))
+        if trigger_r != self._last_trigger_r:
+            self._last_trigger_r = trigger_r
+            r_width = trigger_r * 200 // 255
+            self.trigger_r_bar.place(x=0, y=0, width=r_width)
+            self.trigger_r_label.config(text=f"R: {trigger_r}")
+        
+        # Update sticks (redraws the dot and label)
+        sticks = state['sticks']
+        update_stick = self.update_stick
+        main = (sticks['main_x'], sticks['main_y'])
+        if main != self._last_main:
+            self._last_main = main
+            update_stick(self.main_stick, *main)
+        c = (sticks['c_x'], sticks['c_y'])
+        if c != self._last_c:
+            self._last_c = c
+            update_stick(self.c_stick, *c)
         
     def run(self):
         """Run the GUI main loop."""
         def update_loop():
             if self.driver.running:
-                if self.driver.current_state:
-                    self.update_state(self.driver.current_state)
-                self.root.after(16, update_loop)  # ~60 FPS
+                if self.driver.state_dirty:  # only redraw when a new report arrived
+                    self.driver.state_dirty = False
+                    state = self.driver.current_state  # single read: consistent snapshot
+                    if state:
+                        self.update_state(state)
+                # Every POLL_MS, but run the next update only once Tk is idle (pending redraws done), so a
+                # slow redraw delays the next poll instead of letting timer callbacks pile up
+                self.root.after(self.POLL_MS, self.root.after_idle, update_loop)
             else:
                 self.root.quit()
         
         print("✓ Driver started successfully!")
         print("GUI window opened. Close the window to stop.\n")
         
-        # Force window to appear
-        self.root.update_idletasks()
+        # Show the window; raise it once the main loop is running (no synchronous window manager round-trips)
         self.root.deiconify()
-        self.root.lift()
-        self.root.focus_force()
-        
-        # Make sure window is visible
-        self.root.attributes('-topmost', True)
-        self.root.attributes('-topmost', False)
+        self.root.after(100, self.root.lift)
         
         # Start update loop
         update_loop()
@@ -2198,7 +2384,6 @@ class ControllerGUI:
 
 def main():
     import argparse
-    from datetime import datetime
     
     parser = argparse.ArgumentParser(description='NSO GameCube Controller Driver')
     parser.add_argument('--gui', action='store_true', help='Use GUI mode (requires tkinter or PyQt5)')
@@ -2245,11 +2430,13 @@ def main():
         # Create log file with header
         try:
             with open(log_file, 'w') as f:
-                f.write(f"# NSO GameCube Controller Log\n")
-                f.write(f"# Started: {datetime.now().isoformat()}\n")
-                f.write(f"# Format: JSON Lines (one JSON object per line)\n")
-                f.write(f"# Instructions: Move sticks to cardinal directions (L, R, U, D) and hold for each\n")
-                f.write(f"# Each line represents one sample taken every second\n\n")
+                f.write(
+                    "# NSO GameCube Controller Log\n"
+                    f"# Started: {datetime.now().isoformat()}\n"
+                    "# Format: JSON Lines (one JSON object per line)\n"
+                    "# Instructions: Move sticks to cardinal directions (L, R, U, D) and hold for each\n"
+                    "# Each line represents one sample taken every second\n\n"
+                )
             print(f"Logging to: {log_file}")
             print("Move sticks to cardinal directions (L, R, U, D) and hold each position")
             print("Logging every second...\n")